@@ -43,6 +43,13 @@ def array_units(config: Union[str, Path] = None) -> Dict[str, str]:
     Dict
     """
     conf = read_config(filename=config)
+    # Parse each default unit once; the first unit with a given
+    # dimensionality takes precedence
+    default_units = dict()
+    for val in conf['units']['defaults'].values():
+        default_units.setdefault(
+            _dimensionality_key(dict(units(val).dimensionality)), val
+        )
     d = dict()
     for key, val in conf['arrays']['dimensions'].items():
         dim = _convert_dim_string(val)
@@ -51,10 +58,9 @@ def array_units(config: Union[str, Path] = None) -> Dict[str, str]:
         elif dim == {}:
             d[key] = 'dimensionless'
         else:
-            for key1, val1 in conf['units']['defaults'].items():
-                if _dimensionality_comparison(dict(units(val1).dimensionality), dim):
-                    d[key] = val1
-                    break
+            unit = default_units.get(_dimensionality_key(dim))
+            if unit is not None:
+                d[key] = unit
     return d
 
 
@@ -140,7 +146,5 @@ def _get_code_unit(dim_dict, code_units):
     return unit
 
 
-def _dimensionality_comparison(dim1, dim2):
-    _dim1 = {key: float(val) for key, val in dim1.items()}
-    _dim2 = {key: float(val) for key, val in dim2.items()}
-    return _dim1 == _dim2
+def _dimensionality_key(dim):
+    return frozenset((key, float(val)) for key, val in dim.items())
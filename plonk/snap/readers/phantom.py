@@ -15,7 +15,6 @@ from ..._units import units as plonk_units
 if TYPE_CHECKING:
     from ..snap import Snap
 
-igas, iboundary, istar, idarkmatter, ibulge = 1, 3, 4, 5, 6
 bignumber = 1e29
 missing_infile_parameters = ['alpha', 'alphaB', 'alphau', 'C_cour', 'C_force', 'tolh']
 
@@ -335,19 +334,18 @@ def particle_type(snap: Snap) -> Quantity:
     """
     idust = snap._file_pointer['header/idust'][()]
     ndustlarge = snap._file_pointer['header/ndustlarge'][()]
-    particle_type = np.abs(get_dataset('itype', 'particles')(snap))
-    particle_type[
-        (particle_type >= idust) & (particle_type < idust + ndustlarge)
-    ] = snap.particle_type['dust']
+    itype = np.abs(get_dataset('itype', 'particles')(snap).magnitude)
+    particle_type = np.array(itype, dtype=int)
+    mask = (itype >= idust) & (itype < idust + ndustlarge)
+    particle_type[mask] = snap.particle_type['dust']
     try:
         idustbound = snap._file_pointer['header/idustbound'][()]
-        particle_type[
-            (particle_type >= idustbound) & (particle_type < idustbound + ndustlarge)
-        ] = snap.particle_type['boundary']
+        mask = (itype >= idustbound) & (itype < idustbound + ndustlarge)
+        particle_type[mask] = snap.particle_type['boundary']
     except KeyError:
-        if np.any(particle_type >= idust + ndustlarge):
+        if np.any(itype >= idust + ndustlarge):
             logger.error('Cannot determine dust boundary particles')
-    return np.array(particle_type.magnitude, dtype=int) * plonk_units('dimensionless')
+    return particle_type * plonk_units('dimensionless')
 
 
 def sub_type(snap: Snap) -> Quantity:
@@ -363,58 +361,61 @@ def sub_type(snap: Snap) -> Quantity:
     Dust 3    | n/a |   3  |  3
     ...
     """
-    particle_type = np.abs(get_dataset('itype', 'particles')(snap))
-    sub_type = np.zeros(particle_type.shape, dtype=np.int8)
-    sub_type[
-        (particle_type == igas)
-        | (particle_type == istar)
-        | (particle_type == idarkmatter)
-        | (particle_type == ibulge)
-    ] = 0
-    sub_type[particle_type == iboundary] = 0
+    # Gas, star, dark matter, bulge, and gas boundary particles have
+    # sub-type 0; dust and dust boundary particles are labelled by their
+    # dust species in a single pass over each range of itype
+    itype = np.abs(get_dataset('itype', 'particles')(snap).magnitude)
+    sub_type = np.zeros(itype.shape, dtype=np.int8)
     idust = snap._file_pointer['header/idust'][()]
     ndustlarge = snap._file_pointer['header/ndustlarge'][()]
-    for idx in range(idust, idust + ndustlarge):
-        sub_type[particle_type == idx] = idx - idust + 1
+    mask = (itype >= idust) & (itype < idust + ndustlarge)
+    sub_type[mask] = itype[mask] - idust + 1
     try:
         idustbound = snap._file_pointer['header/idustbound'][()]
-        for idx in range(idustbound, idustbound + ndustlarge):
-            sub_type[particle_type == idx] = idx - idustbound + 1
+        mask = (itype >= idustbound) & (itype < idustbound + ndustlarge)
+        sub_type[mask] = itype[mask] - idustbound + 1
     except KeyError:
-        if np.any(particle_type >= idust + ndustlarge):
+        if np.any(itype >= idust + ndustlarge):
             logger.error('Cannot determine dust boundary particles')
     return sub_type * plonk_units('dimensionless')
 
 
 def mass(snap: Snap) -> Quantity:
     """Particle mass."""
+    return _mass(snap) * snap._array_code_units['mass']
+
+
+def _mass(snap: Snap) -> np.ndarray:
+    # Particle mass in code units
     massoftype = snap._file_pointer['header/massoftype'][()]
-    particle_type = np.array(
-        np.abs(get_dataset('itype', 'particles')(snap)).magnitude, dtype=int
-    )
-    return massoftype[particle_type - 1] * snap._array_code_units['mass']
+    particle_type = np.abs(snap._file_pointer['particles/itype'][()]).astype(int)
+    return massoftype[particle_type - 1]
 
 
 def density(snap: Snap) -> Quantity:
     """Density."""
-    m = (mass(snap) / snap._array_code_units['mass']).magnitude
-    h = (
-        get_dataset('h', 'particles')(snap) / snap._array_code_units['smoothing_length']
-    ).magnitude
-    hfact = snap.properties['smoothing_length_factor']
+    # Mass and smoothing length are read in code units, without attaching
+    # and then removing units
+    m = _mass(snap)
+    h = snap._file_pointer['particles/h'][()].astype(np.float64)
+    hfact = snap._properties['smoothing_length_factor']
     rho = m * (hfact / np.abs(h)) ** 3
     return rho * snap._array_code_units['density']
 
 
 def pressure(snap: Snap) -> Quantity:
     """Pressure."""
+    return _pressure(snap, density(snap))
+
+
+def _pressure(snap: Snap, rho: Quantity) -> Quantity:
+    # Pressure given the density, so it is not read again
     ieos = snap._file_pointer['header/ieos'][()]
     K = 2 / 3 * snap._file_pointer['header/RK2'][()]
-    gamma = snap.properties['adiabatic_index']
-    rho = density(snap)
+    gamma = snap._properties['adiabatic_index']
     if ieos == 1:
         # Globally isothermal
-        K = K * snap.code_units['length'] ** 2 * snap.code_units['time'] ** (-2)
+        K = K * snap._code_units['length'] ** 2 * snap._code_units['time'] ** (-2)
         return K * rho
     if ieos == 2:
         # Adiabatic
@@ -427,14 +428,14 @@ def pressure(snap: Snap) -> Quantity:
         except KeyError:
             K = (
                 K
-                * snap.code_units['length'] ** (1 - gamma)
-                * snap.code_units['mass'] ** (-1 + 3 * gamma)
-                * snap.code_units['time'] ** (-2)
+                * snap._code_units['length'] ** (1 - gamma)
+                * snap._code_units['mass'] ** (-1 + 3 * gamma)
+                * snap._code_units['time'] ** (-2)
             )
             return K * rho ** (gamma - 1)
     if ieos == 3:
         # Vertically isothermal (for accretion disc)
-        K = K * snap.code_units['length'] ** 2 * snap.code_units['time'] ** (-2)
+        K = K * snap._code_units['length'] ** 2 * snap._code_units['time'] ** (-2)
         q = snap._file_pointer['header/qfacdisc'][()]
         pos = get_dataset('xyz', 'particles')(snap)
         r_squared = pos[:, 0] ** 2 + pos[:, 1] ** 2 + pos[:, 2] ** 2
@@ -446,9 +447,9 @@ def pressure(snap: Snap) -> Quantity:
 def sound_speed(snap: Snap) -> Quantity:
     """Sound speed."""
     ieos = snap._file_pointer['header/ieos'][()]
-    gamma = snap.properties['adiabatic_index']
+    gamma = snap._properties['adiabatic_index']
     rho = density(snap)
-    P = pressure(snap)
+    P = _pressure(snap, rho)
     if ieos in (1, 3):
         return np.sqrt(P / rho)
     if ieos == 2:
@@ -459,20 +460,20 @@ def sound_speed(snap: Snap) -> Quantity:
 def stopping_time(snap: Snap) -> Quantity:
     """Dust stopping time."""
     stopping_time = get_dataset('tstop', 'particles')(snap)
-    stopping_time[stopping_time == bignumber] = np.inf * snap.code_units['time']
+    stopping_time[stopping_time == bignumber] = np.inf * snap._code_units['time']
     return stopping_time
 
 
 def dust_fraction(snap: Snap) -> Quantity:
     """Dust fraction for mixture method (1-fluid)."""
-    if snap.properties['dust_method'] != 'dust/gas mixture':
+    if snap._properties['dust_method'] != 'dust/gas mixture':
         raise ValueError('Dust fraction only available for "dust/gas mixture"')
     return get_dataset('dustfrac', 'particles')(snap)
 
 
 def dust_to_gas_ratio(snap: Snap) -> Quantity:
     """Dust-to-gas ratio for separate particles method (2-fluid)."""
-    if snap.properties['dust_method'] != 'dust as separate sets of particles':
+    if snap._properties['dust_method'] != 'dust as separate sets of particles':
         raise ValueError(
             'Dust fraction only available for "dust as separate sets of particles"'
         )
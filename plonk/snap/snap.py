@@ -7,8 +7,9 @@ accessing a subset of particles in a Snap.
 
 from __future__ import annotations
 
+import weakref
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import h5py
 import numpy as np
@@ -24,7 +25,7 @@ from .._logging import logger
 from .._units import Quantity, array_units, generate_array_code_units
 from .._units import units as plonk_units
 from ..utils.kernels import kernel_names, kernel_radius
-from ..utils.math import norm
+from ..utils.math import norm, rotate_vectors
 from ..utils.snap import add_aliases
 from . import context
 from .extra import add_quantities as _add_quantities
@@ -135,6 +136,7 @@ class Snap:
         self._num_sinks = -1
         self._num_dust_species = -1
         self.rotation = None
+        self._rotation_matrix = None
         self.translation = None
         self._tree = None
 
@@ -358,6 +360,12 @@ class Snap:
 
         return sorted(set(loaded + registered))
 
+    def _has_array(self, name: str, sinks: bool = False) -> bool:
+        """Check if an array is available, without listing the arrays."""
+        if sinks:
+            return name in self._sink_arrays or name in self._sink_registry
+        return name in self._arrays or name in self._array_registry
+
     def available_arrays(
         self, verbose: bool = False, aliases: bool = False
     ) -> List[str]:
@@ -450,7 +458,7 @@ class Snap:
         >>> snap.set_units(pressure='pascal', density='g/cm^3')
         """
         for key, val in kwargs.items():
-            if key not in self.default_units:
+            if key not in self._default_units:
                 logger.info(f'adding array {key} to default_units dict')
             self._default_units[key] = val
 
@@ -516,7 +524,7 @@ class Snap:
     def num_dust_species(self) -> int:
         """Return number of dust species."""
         if self._num_dust_species == -1:
-            self._num_dust_species = len(self.properties.get('grain_size', []))
+            self._num_dust_species = len(self._properties.get('grain_size', []))
         return self._num_dust_species
 
     @property
@@ -561,6 +569,7 @@ class Snap:
 
         if rotation:
             self.rotation = None
+            self._rotation_matrix = None
         if translation:
             self.translation = None
 
@@ -610,6 +619,9 @@ class Snap:
             _rotation = axis / norm(axis) * angle
         if isinstance(_rotation, (list, tuple, ndarray)):
             _rotation = Rotation.from_rotvec(_rotation)
+        if np.all(_rotation.magnitude() == 0):
+            # Identity rotation: keep the cached arrays
+            return self
 
         for arr in self.loaded_arrays():
             del self[arr]
@@ -622,6 +634,7 @@ class Snap:
         else:
             rot = _rotation * self.rotation
             self.rotation = rot
+        self._rotation_matrix = self.rotation.as_matrix()
 
         return self
 
@@ -648,19 +661,10 @@ class Snap:
             in-place.
         """
         logger.debug(f'Translating snapshot: {self.file_path.name}')
-        if isinstance(translation, (list, tuple)):
-            translation = np.array(translation, dtype=np.float)
-        if translation.shape != (3,):
-            raise ValueError('translation must be like (x, y, z)')
-        if isinstance(translation, Quantity):
-            if unit is not None:
-                logger.warning('units argument ignored as translation has units')
-        else:
-            if unit is None:
-                raise ValueError(
-                    'translation must have units, or you must specify units argument'
-                )
-            translation *= plonk_units(unit)
+        translation = _translation_with_units(translation, unit)
+        if not np.any(translation.magnitude):
+            # Zero translation: keep the cached arrays
+            return self
 
         for arr in self.loaded_arrays():
             del self[arr]
@@ -697,26 +701,21 @@ class Snap:
             is True, return a single array.
         """
         with self.context(cache=False):
-            ptype = self['type']
-            stype = self['sub_type']
+            ptype = self['type'].magnitude
+            stype = self['sub_type'].magnitude
 
+        # Find the particles of this type once, then split into sub-types
+        # by looking only at the sub-type of those particles
+        ind = np.flatnonzero(ptype == self.particle_type[particle_type])
         if particle_type == 'dust' and not squeeze:
             # Dust particle sub-type skips zero: 1, 2, 3 ...
-            return [
-                np.flatnonzero(
-                    (ptype == self.particle_type['dust']) & (stype == idx + 1)
-                )
-                for idx in range(self.num_dust_species)
-            ]
+            sub = stype[ind]
+            return [ind[sub == idx + 1] for idx in range(self.num_dust_species)]
         if particle_type == 'boundary' and not squeeze:
             # Boundary particle sub-type: 0 (gas), 1, 2, 3... (dust)
-            return [
-                np.flatnonzero(
-                    (ptype == self.particle_type['boundary']) & (stype == idx)
-                )
-                for idx in range(self.num_dust_species + 1)
-            ]
-        return np.flatnonzero(ptype == self.particle_type[particle_type])
+            sub = stype[ind]
+            return [ind[sub == idx] for idx in range(self.num_dust_species + 1)]
+        return ind
 
     def subsnaps_as_dict(
         self, squeeze: bool = False
@@ -1077,8 +1076,8 @@ class Snap:
             _arr: Quantity = self[base_name]
             dim = _arr.units.dimensionality
             unit = 1.0
-            for d in self.code_units:
-                unit *= self.code_units[d] ** dim[f'[{d}]']
+            for d in self._code_units:
+                unit *= self._code_units[d] ** dim[f'[{d}]']
         return unit
 
     def array_in_code_units(self, name: str) -> ndarray:
@@ -1115,9 +1114,9 @@ class Snap:
         str
             The base array name.
         """
-        if name in self.available_arrays():
+        if self._has_array(name):
             return name
-        if self.num_sinks > 0 and name in self.sinks.available_arrays():
+        if self.num_sinks > 0 and self._has_array(name, sinks=True):
             return name
         if name in self._array_aliases:
             return self._array_aliases[name]
@@ -1141,9 +1140,9 @@ class Snap:
         raise ValueError('Unknown array')
 
     def _array_suffix(self, name: str) -> str:
-        if name in self.available_arrays() or name in self._array_aliases:
+        if self._has_array(name) or name in self._array_aliases:
             return ''
-        if self.num_sinks > 0 and name in self.sinks.available_arrays():
+        if self.num_sinks > 0 and self._has_array(name, sinks=True):
             return ''
         if name in self._arrays:
             return ''
@@ -1167,24 +1166,15 @@ class Snap:
     def _array_transform(
         self, base_name: str, suffix: str
     ) -> Tuple[Callable, tuple, Dict[str, Any]]:
-        def nothing(x):
-            return x
-
         if base_name in self._vector_arrays:
-            if suffix == 'x':
-                return nothing, (..., 0), {}
-            if suffix == 'y':
-                return nothing, (..., 1), {}
-            if suffix == 'z':
-                return nothing, (..., 2), {}
-            if suffix == 'mag':
-                return norm, (), {'axis': 1}
+            if suffix in _vector_transforms:
+                return _vector_transforms[suffix]
         if base_name in self._dust_arrays:
             if _str_is_int(suffix):
                 if int(suffix) < 1 or int(suffix) > self.num_dust_species:
                     pass
                 else:
-                    return nothing, (..., int(suffix) - 1), {}
+                    return _nothing, (..., int(suffix) - 1), {}
 
         raise ValueError('Unknown array')
 
@@ -1195,7 +1185,7 @@ class Snap:
             array = self._array_registry[name](self)
         if self.rotation is not None and name in self._vector_arrays:
             array_m, array_u = array.magnitude, array.units
-            array = self.rotation.apply(array_m) * array_u
+            array = rotate_vectors(array_m, self._rotation_matrix) * array_u
         if self.translation is not None and name == 'position':
             array += self.translation
         return array
@@ -1207,13 +1197,13 @@ class Snap:
         else:
             array_dict = self._arrays
         if name in array_dict:
-            if name in self.default_units:
-                return array_dict[name].to(self.default_units[name])
+            if name in self._default_units:
+                return array_dict[name].to(self._default_units[name])
             return array_dict[name]
         if name in self._array_registry or name in self._sink_registry:
-            if name in self.default_units:
+            if name in self._default_units:
                 array = self._get_array_from_registry(name, sinks).to(
-                    self.default_units[name]
+                    self._default_units[name]
                 )
             else:
                 array = self._get_array_from_registry(name, sinks)
@@ -1247,12 +1237,12 @@ class Snap:
             raise ValueError('"item" must be Pint Quantity')
         if item.shape[0] != len(self):
             raise ValueError('Length of array does not match particle number')
-        if name in self.loaded_arrays():
+        if name in self._arrays:
             raise ValueError(
                 'Attempting to overwrite existing array. To do so, first delete the '
                 'array\nwith del snap["array"], then try again.'
             )
-        if name in self._available_arrays() or name in self._array_aliases.keys():
+        if self._has_array(name) or name in self._array_aliases:
             raise ValueError(
                 'Attempting to set array already available. '
                 'See snap.available_arrays().'
@@ -1331,12 +1321,14 @@ class SubSnap(Snap):
         if len(ind) == 0:
             logger.warning('SubSnap has no particles')
         self._indices = ind
+        self._slice = _indices_to_slice(ind)
 
         # Attributes different to Snap
         self._num_particles = len(self._indices)
         self._num_particles_of_type = -1
         self._num_dust_species = -1
         self._tree = None
+        self._subsnap_arrays: Dict[str, Tuple[weakref.ref, Quantity]] = {}
 
         # Attributes same as Snap
         self.data_source = self.base.data_source
@@ -1352,6 +1344,7 @@ class SubSnap(Snap):
         self._sink_arrays = self.base._sink_arrays
         self._file_pointer = self.base._file_pointer
         self.rotation = self.base.rotation
+        self._rotation_matrix = self.base._rotation_matrix
         self.translation = self.base.translation
 
     @property
@@ -1373,7 +1366,60 @@ class SubSnap(Snap):
         return f'<plonk.SubSnap "{self.file_path.name}">'
 
     def _get_array(self, name: str, sinks: bool = False) -> Quantity:
-        return self.base._get_array(name, sinks)[self.indices]
+        if sinks:
+            return self.base._get_array(name, sinks)[self.indices]
+
+        # Re-use the indexed array while the array it was taken from is
+        # still cached on the base Snap. Rotations, translations, etc.
+        # delete the cached base array which invalidates this copy. A copy
+        # is returned, as for a fresh gather, so that in-place changes do
+        # not modify the re-used array.
+        source = self._arrays.get(name)
+        if source is not None and name in self._subsnap_arrays:
+            ref, array = self._subsnap_arrays[name]
+            if ref() is source:
+                array = array.copy()
+                if name in self._default_units:
+                    array.ito(self._default_units[name])
+                return array
+
+        # Contiguous particles are sliced, which is a view on the base array
+        # rather than a gather. The view is cached and a copy is returned.
+        if self._slice is not None:
+            array = self.base._get_array(name, sinks)[self._slice]
+        else:
+            array = self.base._get_array(name, sinks)[self.indices]
+        source = self._arrays.get(name)
+        if self.cache_arrays and source is not None:
+            callback = _remove_subsnap_array(self._subsnap_arrays, name)
+            cached = array if self._slice is not None else array.copy()
+            self._subsnap_arrays[name] = (weakref.ref(source, callback), cached)
+        if self._slice is not None:
+            array = array.copy()
+        return array
+
+
+def _nothing(x):
+    return x
+
+
+# Transform, slice, and transform kwargs for vector array suffixes
+_vector_transforms: Dict[str, Tuple[Callable, tuple, Dict[str, Any]]] = {
+    'x': (_nothing, (..., 0), {}),
+    'y': (_nothing, (..., 1), {}),
+    'z': (_nothing, (..., 2), {}),
+    'mag': (norm, (), {'axis': 1}),
+}
+
+
+def _remove_subsnap_array(subsnap_arrays, name):
+    """Weakref callback to drop an indexed array once its source is freed."""
+
+    def callback(ref):
+        if name in subsnap_arrays and subsnap_arrays[name][0] is ref:
+            del subsnap_arrays[name]
+
+    return callback
 
 
 SnapLike = Union[Snap, SubSnap]
@@ -1425,7 +1471,9 @@ class Sinks:
         self.file_path = self.base.file_path
         self.base_array_name = self.base.base_array_name
         self.default_units = self.base.default_units
+        self._default_units = self.base._default_units
         self.rotation = self.base.rotation
+        self._rotation_matrix = self.base._rotation_matrix
         self.translation = self.base.translation
 
     @property
@@ -1546,6 +1594,38 @@ def _str_is_int(string: str) -> bool:
         return False
 
 
+def _translation_with_units(
+    translation: Union[Quantity, ndarray, list, tuple], unit: Optional[str]
+) -> Quantity:
+    """Return a translation like (x, y, z) as a Quantity."""
+    if isinstance(translation, (list, tuple)):
+        translation = np.array(translation, dtype=np.float)
+    if translation.shape != (3,):
+        raise ValueError('translation must be like (x, y, z)')
+    if isinstance(translation, Quantity):
+        if unit is not None:
+            logger.warning('units argument ignored as translation has units')
+    else:
+        if unit is None:
+            raise ValueError(
+                'translation must have units, or you must specify units argument'
+            )
+        translation *= plonk_units(unit)
+    return translation
+
+
+def _indices_to_slice(indices: ndarray) -> Optional[slice]:
+    """Return a slice equivalent to the indices if they are contiguous."""
+    if not isinstance(indices, ndarray) or indices.ndim != 1 or len(indices) == 0:
+        return None
+    start, stop = int(indices[0]), int(indices[-1]) + 1
+    if start < 0 or stop - start != len(indices):
+        return None
+    if np.any(np.diff(indices) != 1):
+        return None
+    return slice(start, stop)
+
+
 def _input_indices_array(
     inp: Union[ndarray, slice, list, int, tuple], max_slice: int
 ) -> Union[ndarray, List[int]]:
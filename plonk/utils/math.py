@@ -1,7 +1,11 @@
 """Utils for math."""
 
+from typing import Union
+
+import numba
 import numpy as np
 from numpy import ndarray
+from scipy.spatial.transform import Rotation
 
 from .._units import Quantity
 
@@ -96,3 +100,45 @@ def distance_from_plane(
     a, b, c = normal
     d = height
     return np.abs((a * x + b * y + c * z + d) / np.sqrt(a ** 2 + b ** 2 + c ** 2))
+
+
+def rotate_vectors(vectors: ndarray, rotation: Union[Rotation, ndarray]) -> ndarray:
+    """Apply a rotation to an array of vectors.
+
+    This is equivalent to rotation.apply(vectors). For a single rotation
+    of an (N, 3) array the rotation matrix is applied in one pass without
+    temporary arrays.
+
+    Parameters
+    ----------
+    vectors
+        The vectors to rotate as an (N, 3) array.
+    rotation
+        The rotation as a scipy.spatial.transform.Rotation object, or
+        as a rotation matrix, e.g. from Rotation.as_matrix.
+
+    Returns
+    -------
+    ndarray
+        The rotated vectors.
+    """
+    if isinstance(rotation, Rotation):
+        matrix = rotation.as_matrix()
+    else:
+        matrix = rotation
+    if vectors.ndim != 2 or vectors.shape[1] != 3 or matrix.shape != (3, 3):
+        if not isinstance(rotation, Rotation):
+            rotation = Rotation.from_matrix(matrix)
+        return rotation.apply(vectors)
+    return _rotate_vectors(vectors, matrix)
+
+
+@numba.njit(cache=True)
+def _rotate_vectors(vectors, matrix):
+    rotated = np.empty(vectors.shape)
+    for idx in range(vectors.shape[0]):
+        x, y, z = vectors[idx, 0], vectors[idx, 1], vectors[idx, 2]
+        rotated[idx, 0] = matrix[0, 0] * x + matrix[0, 1] * y + matrix[0, 2] * z
+        rotated[idx, 1] = matrix[1, 0] * x + matrix[1, 1] * y + matrix[1, 2] * z
+        rotated[idx, 2] = matrix[2, 0] * x + matrix[2, 1] * y + matrix[2, 2] * z
+    return rotated
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import math
 from typing import TYPE_CHECKING, Any, List, Tuple, Union
 
 import matplotlib.pyplot as plt
@@ -22,6 +23,9 @@ from .._units import Quantity
 if TYPE_CHECKING:
     from ..snap.snap import SnapLike
 
+# The maximum number of particles used to estimate the extent by percentile
+EXTENT_SAMPLE_SIZE = 2 ** 16
+
 
 def plot_smoothing_length(
     snap: SnapLike,
@@ -119,10 +123,19 @@ def get_extent_from_percentile(
     -------
     tuple
         The extent of the box as (xmin, xmax, ymin, ymax).
+
+    Notes
+    -----
+    For more than EXTENT_SAMPLE_SIZE particles, the percentiles are
+    estimated from an evenly strided sample of that many particles.
     """
     pl, pr = (100 - percentile) / 2, percentile + (100 - percentile) / 2
-    xlim = np.percentile(snap[x], [pl, pr])
-    ylim = np.percentile(snap[y], [pl, pr])
+    _x, _y = get_coordinates(snap=snap, x=x, y=y)
+    stride = -(-np.size(_x) // EXTENT_SAMPLE_SIZE)
+    if stride > 1:
+        _x, _y = _x[::stride], _y[::stride]
+    xlim = _percentile(_x, [pl, pr])
+    ylim = _percentile(_y, [pl, pr])
 
     if x_center_on is not None:
         xlim += x_center_on - xlim.mean()
@@ -139,6 +152,62 @@ def get_extent_from_percentile(
     return (xlim[0], xlim[1], ylim[0], ylim[1])
 
 
+def _percentile(array: Union[Quantity, ndarray], q: List[float]):
+    """Percentiles by linear interpolation, as np.percentile.
+
+    One partition is made about the neighbouring elements of all the
+    percentiles, rather than going through np.percentile.
+    """
+    if isinstance(array, Quantity):
+        return _percentile(array.magnitude, q) * array.units
+    array = np.ravel(array)
+    index = np.asarray(q, dtype=float) / 100 * (array.size - 1)
+    lower = np.floor(index).astype(int)
+    upper = np.minimum(lower + 1, array.size - 1)
+    partitioned = np.partition(array, np.unique(np.concatenate((lower, upper))))
+    below, above = partitioned[lower], partitioned[upper]
+    # Interpolate from the nearer element, as np.percentile does
+    t = index - lower
+    diff = above - below
+    return np.where(t >= 0.5, above - diff * (1 - t), below + diff * t)
+
+
+def get_coordinates(snap: SnapLike, x: str, y: str) -> Tuple[Quantity, Quantity]:
+    """Get the x and y arrays for a plot.
+
+    If both x and y are position components, e.g. 'x' and 'y', they are
+    taken as columns of the position array, which is only got once.
+
+    Parameters
+    ----------
+    snap
+        The Snap object.
+    x
+        The "x" coordinate.
+    y
+        The "y" coordinate.
+
+    Returns
+    -------
+    tuple
+        The x and y arrays.
+    """
+    columns = {'x': 0, 'y': 1, 'z': 2}
+    try:
+        suffixes = [
+            snap._array_suffix(name)
+            for name in (x, y)
+            if snap.base_array_name(name) == 'position'
+        ]
+    except (AttributeError, ValueError):
+        # Sinks, or unknown arrays which raise on snap[x]
+        suffixes = []
+    if len(suffixes) == 2 and all(suffix in columns for suffix in suffixes):
+        position = snap['position']
+        return position[:, columns[suffixes[0]]], position[:, columns[suffixes[1]]]
+    return snap[x], snap[y]
+
+
 def cartesian_to_polar(
     interpolated_data_cartesian: ndarray,
     extent_cartesian: Tuple[float, float, float, float],
@@ -167,7 +236,7 @@ def cartesian_to_polar(
         )
     data, extent = interpolated_data_cartesian, extent_cartesian
 
-    if not np.allclose(extent[1] - extent[0], extent[3] - extent[2]):
+    if not math.isclose(extent[1] - extent[0], extent[3] - extent[2], rel_tol=1e-5):
         raise ValueError('Bad polar plot: x and y have different scales')
 
     num_pixels = data.shape
@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Union
 
 import matplotlib.pyplot as plt
+import numpy as np
 from matplotlib import animation as _animation
 
 try:
@@ -16,6 +17,7 @@ except ImportError:
 from .._logging import logger
 from .._units import units as plonk_units
 from . import visualization as viz
+from .interpolation import _to_float32
 
 if TYPE_CHECKING:
     from ..analysis.profile import Profile
@@ -274,6 +276,7 @@ def animation_images(
     units = kwargs.get('units')
     weighted = kwargs.get('weighted')
     num_pixels = kwargs.get('num_pixels')
+    dtype = kwargs.get('dtype', np.float32)
 
     def animate(idx):
         if tqdm is not None:
@@ -291,11 +294,11 @@ def animation_images(
             units=units,
             weighted=weighted,
             num_pixels=num_pixels,
+            dtype=dtype,
         )
-        image.set_data(interp_data)
+        image.set_data(_to_float32(interp_data))
         image.set_extent(_extent)
-        image.axes.set_xlim(_extent[:2])
-        image.axes.set_ylim(_extent[2:])
+        viz._set_limits(ax=image.axes, extent=_extent)
         if adaptive_colorbar:
             vmin = kwargs.get('vmin', interp_data.min())
             vmax = kwargs.get('vmax', interp_data.max())
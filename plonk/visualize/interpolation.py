@@ -6,8 +6,10 @@ for interpolation of vector fields.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Tuple
 
+import numba
 import numpy as np
 from numpy import ndarray
 
@@ -37,6 +39,7 @@ def interpolate(
     slice_offset: Quantity = None,
     extent: Quantity,
     num_pixels: Tuple[float, float] = None,
+    dtype: Any = np.float32,
 ) -> Quantity:
     """Interpolate a quantity on the snapshot to a pixel grid.
 
@@ -69,6 +72,11 @@ def interpolate(
     num_pixels
         The pixel grid to interpolate the scalar quantity to, as
         (npixx, npixy). Default is (512, 512).
+    dtype
+        The float type of the particle arrays passed to the
+        interpolation kernels. Default is np.float32. Arrays with values
+        outside the float32 range are kept as is. The pixel values are
+        always summed in float64.
 
     Returns
     -------
@@ -94,15 +102,17 @@ def interpolate(
     if num_pixels is None:
         num_pixels = NUM_PIXELS
 
-    _quantity, x, y, z = _get_arrays_from_str(snap=snap, quantity=quantity, x=x, y=y)
+    _quantity, x, y, z = _get_arrays_from_str(
+        snap=snap, quantity=quantity, x=x, y=y, interp=interp
+    )
     h = snap.array_in_code_units('smoothing_length')
     m = snap.array_in_code_units('mass')
 
     extent = (
-        (extent[0] / snap.code_units['length']).to_base_units().magnitude,
-        (extent[1] / snap.code_units['length']).to_base_units().magnitude,
-        (extent[2] / snap.code_units['length']).to_base_units().magnitude,
-        (extent[3] / snap.code_units['length']).to_base_units().magnitude,
+        (extent[0] / snap._code_units['length']).to_base_units().magnitude,
+        (extent[1] / snap._code_units['length']).to_base_units().magnitude,
+        (extent[2] / snap._code_units['length']).to_base_units().magnitude,
+        (extent[3] / snap._code_units['length']).to_base_units().magnitude,
     )
 
     if interp == 'projection':
@@ -119,7 +129,7 @@ def interpolate(
         if slice_normal is None:
             slice_normal = np.array([0, 0, 1])
         slice_offset = (
-            (slice_offset / snap.code_units['length']).to_base_units().magnitude
+            (slice_offset / snap._code_units['length']).to_base_units().magnitude
         )
         dist_from_slice = distance_from_plane(x, y, z, slice_normal, slice_offset)
 
@@ -132,9 +142,10 @@ def interpolate(
             extent=extent,
             smoothing_length=h,
             particle_mass=m,
-            hfact=snap.properties['smoothing_length_factor'],
+            hfact=snap._properties['smoothing_length_factor'],
             weighted=weighted,
             num_pixels=num_pixels,
+            dtype=dtype,
         )
 
     elif _quantity.ndim == 2:
@@ -147,9 +158,10 @@ def interpolate(
             extent=extent,
             smoothing_length=h,
             particle_mass=m,
-            hfact=snap.properties['smoothing_length_factor'],
+            hfact=snap._properties['smoothing_length_factor'],
             weighted=weighted,
             num_pixels=num_pixels,
+            dtype=dtype,
         )
 
     else:
@@ -173,6 +185,7 @@ def scalar_interpolation(
     hfact: float,
     weighted: bool = None,
     num_pixels: Tuple[float, float] = (512, 512),
+    dtype: Any = np.float32,
 ) -> ndarray:
     """Interpolate scalar quantity to a pixel grid.
 
@@ -200,6 +213,9 @@ def scalar_interpolation(
     num_pixels
         The pixel grid to interpolate the scalar quantity to, as
         (npixx, npixy). Default is (512, 512).
+    dtype
+        The float type of the particle arrays passed to the
+        interpolation kernels. Default is np.float32.
 
     Returns
     -------
@@ -207,15 +223,27 @@ def scalar_interpolation(
         An array of scalar quantities interpolated to a pixel grid with
         shape (npixx, npixy).
     """
+    weight, itype = _interpolation_weights(
+        smoothing_length=smoothing_length,
+        particle_mass=particle_mass,
+        hfact=hfact,
+        weighted=weighted,
+    )
+    x_coordinate, y_coordinate, extent = _kernel_coordinates(
+        x_coordinate, y_coordinate, extent=extent, dtype=dtype
+    )
+    arrays = _kernel_arrays(
+        dist_from_slice, smoothing_length, weight, quantity, dtype=dtype,
+    )
     return _interpolate(
-        quantity=quantity,
+        quantity=arrays[3],
         x_coordinate=x_coordinate,
         y_coordinate=y_coordinate,
-        dist_from_slice=dist_from_slice,
+        dist_from_slice=arrays[0],
         extent=extent,
-        smoothing_length=smoothing_length,
-        particle_mass=particle_mass,
-        hfact=hfact,
+        smoothing_length=arrays[1],
+        weight=arrays[2],
+        itype=itype,
         weighted=weighted,
         num_pixels=num_pixels,
     )
@@ -234,6 +262,7 @@ def vector_interpolation(
     hfact: float,
     weighted: bool = None,
     num_pixels: Tuple[float, float] = (512, 512),
+    dtype: Any = np.float32,
 ) -> ndarray:
     """Interpolate scalar quantity to a pixel grid.
 
@@ -263,6 +292,9 @@ def vector_interpolation(
     num_pixels
         The pixel grid to interpolate the scalar quantity to, as
         (npixx, npixy). Default is (512, 512).
+    dtype
+        The float type of the particle arrays passed to the
+        interpolation kernels. Default is np.float32.
 
     Returns
     -------
@@ -270,30 +302,38 @@ def vector_interpolation(
         An array of vector quantities interpolated to a pixel grid with
         shape (2, npixx, npixy).
     """
-    vecsmoothx = _interpolate(
-        quantity=quantity_x,
-        x_coordinate=x_coordinate,
-        y_coordinate=y_coordinate,
-        dist_from_slice=dist_from_slice,
-        extent=extent,
+    # The weights do not depend on the quantity so are shared between the
+    # vector components
+    weight, itype = _interpolation_weights(
         smoothing_length=smoothing_length,
         particle_mass=particle_mass,
         hfact=hfact,
         weighted=weighted,
-        num_pixels=num_pixels,
     )
-    vecsmoothy = _interpolate(
-        quantity=quantity_y,
+    x_coordinate, y_coordinate, extent = _kernel_coordinates(
+        x_coordinate, y_coordinate, extent=extent, dtype=dtype
+    )
+    arrays = _kernel_arrays(
+        dist_from_slice, smoothing_length, weight, quantity_x, quantity_y, dtype=dtype,
+    )
+    quantity_x, quantity_y = arrays[3], arrays[4]
+    kwargs = dict(
         x_coordinate=x_coordinate,
         y_coordinate=y_coordinate,
-        dist_from_slice=dist_from_slice,
+        dist_from_slice=arrays[0],
         extent=extent,
-        smoothing_length=smoothing_length,
-        particle_mass=particle_mass,
-        hfact=hfact,
+        smoothing_length=arrays[1],
+        weight=arrays[2],
+        itype=itype,
         weighted=weighted,
         num_pixels=num_pixels,
     )
+    # The Splash kernels release the GIL, so interpolate the components
+    # concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        future_x = executor.submit(_interpolate, quantity=quantity_x, **kwargs)
+        future_y = executor.submit(_interpolate, quantity=quantity_y, **kwargs)
+        vecsmoothx, vecsmoothy = future_x.result(), future_y.result()
     return np.stack((np.array(vecsmoothx), np.array(vecsmoothy)))
 
 
@@ -305,8 +345,8 @@ def _interpolate(
     dist_from_slice: ndarray = None,
     extent: Extent,
     smoothing_length: ndarray,
-    particle_mass: ndarray,
-    hfact: float,
+    weight: ndarray,
+    itype: ndarray,
     weighted: bool = None,
     num_pixels: Tuple[float, float],
 ) -> ndarray:
@@ -326,12 +366,6 @@ def _interpolate(
     pixwidthy = (extent[3] - extent[2]) / npixy
     npart = len(smoothing_length)
 
-    itype = np.ones(smoothing_length.shape)
-    if weighted:
-        weight = particle_mass / smoothing_length ** 3
-    else:
-        weight = hfact ** -3 * np.ones(smoothing_length.shape)
-
     if do_slice:
         interpolated_data = interpolate_slice(
             x=x_coordinate,
@@ -371,7 +405,83 @@ def _interpolate(
     return interpolated_data
 
 
-def _get_arrays_from_str(*, snap, quantity, x, y):
+def _interpolation_weights(
+    *,
+    smoothing_length: ndarray,
+    particle_mass: ndarray,
+    hfact: float,
+    weighted: bool = None,
+) -> Tuple[ndarray, ndarray]:
+    # The kernels only check the sign of the particle type
+    itype = np.ones(smoothing_length.shape, dtype=np.int8)
+    if weighted:
+        # Compute m / h^3 in a single buffer with the precision of m / h^3
+        weight = np.empty(
+            smoothing_length.shape,
+            dtype=np.result_type(particle_mass, smoothing_length),
+        )
+        np.power(smoothing_length, 3, out=weight)
+        np.divide(particle_mass, weight, out=weight)
+    else:
+        weight = np.full(smoothing_length.shape, hfact ** -3)
+    return weight, itype
+
+
+def _kernel_coordinates(
+    x_coordinate: ndarray, y_coordinate: ndarray, *, extent: Extent, dtype: Any
+) -> Tuple[ndarray, ndarray, Extent]:
+    """Shift the coordinates to the extent origin for the kernels.
+
+    The shift is done in the precision of the coordinates, before they
+    are cast, so float32 resolves the pixels however far the extent is
+    from the origin.
+    """
+    xmin, ymin = extent[0], extent[2]
+    x = np.empty(x_coordinate.shape, dtype=dtype)
+    y = np.empty(y_coordinate.shape, dtype=dtype)
+    np.subtract(x_coordinate, xmin, out=x, casting='unsafe')
+    np.subtract(y_coordinate, ymin, out=y, casting='unsafe')
+    return x, y, (0.0, extent[1] - xmin, 0.0, extent[3] - ymin)
+
+
+def _kernel_arrays(*arrays: ndarray, dtype: Any) -> Tuple[ndarray, ...]:
+    """Cast the particle arrays for the interpolation kernels."""
+    if np.dtype(dtype) == np.float32:
+        return tuple(
+            None if a is None else np.ascontiguousarray(_to_float32(a)) for a in arrays
+        )
+    return tuple(
+        None if a is None else np.ascontiguousarray(a, dtype=dtype) for a in arrays
+    )
+
+
+def _to_float32(data: ndarray) -> ndarray:
+    """Convert to float32 unless values would overflow or underflow."""
+    if data.dtype == np.float32:
+        return data
+    finfo = np.finfo(np.float32)
+    largest, smallest = _magnitude_range(data)
+    if largest > finfo.max or smallest < finfo.tiny:
+        return data
+    return np.ascontiguousarray(data, dtype=np.float32)
+
+
+@numba.njit(cache=True)
+def _magnitude_range(data):
+    # The largest and smallest finite non-zero magnitudes, in one pass
+    # without temporary arrays
+    largest = 0.0
+    smallest = np.inf
+    for value in data.flat:
+        magnitude = abs(value)
+        if magnitude < np.inf:
+            largest = max(largest, magnitude)
+            if magnitude > 0:
+                smallest = min(smallest, magnitude)
+    return largest, smallest
+
+
+def _get_arrays_from_str(*, snap, quantity, x, y, interp='projection'):
 
     coords = {'x', 'y', 'z'}
     if x not in coords:
@@ -382,19 +492,26 @@ def _get_arrays_from_str(*, snap, quantity, x, y):
     quantity_str, x_str, y_str = quantity, x, y
     z_str = coords.difference((x_str, y_str)).pop()
 
+    # Get position once and take views of the columns rather than getting,
+    # and converting, each coordinate separately; they are copied once when
+    # cast for the interpolation kernels. The z-coordinate is only required
+    # for slices
+    columns = {'x': 0, 'y': 1, 'z': 2}
+    position = snap.array_in_code_units('position')
+    x = position[:, columns[x_str]]
+    y = position[:, columns[y_str]]
+    z = position[:, columns[z_str]] if interp == 'slice' else None
+
     quantity = snap.array_in_code_units(quantity_str)
-    x = snap.array_in_code_units(x_str)
-    y = snap.array_in_code_units(y_str)
-    z = snap.array_in_code_units(z_str)
 
     if quantity.ndim > 2:
         raise ValueError('Cannot interpret quantity with ndim > 2')
     if quantity.ndim == 2:
-        try:
-            quantity_x = snap.array_in_code_units(quantity_str + '_' + x_str)
-            quantity_y = snap.array_in_code_units(quantity_str + '_' + y_str)
+        if snap.base_array_name(quantity_str) in snap._vector_arrays:
+            quantity_x = quantity[:, columns[x_str]]
+            quantity_y = quantity[:, columns[y_str]]
             quantity = np.stack([quantity_x, quantity_y]).T
-        except ValueError:
+        else:
             raise ValueError(
                 '2d quantity must be a vector quantity, e.g. "velocity".\n'
                 'For dust quantities, try appending the dust species number,\n'
@@ -8,7 +8,14 @@ import numpy as np
 from numpy import ndarray
 
 from .._logging import logger
-from .interpolation import Extent
+from .interpolation import Extent, _to_float32
+
+# Artists with more markers or arrows than this are rasterized by default
+RASTERIZE_THRESHOLD = 10_000
+
+# Names of the image norms
+LINEAR_NORM_NAMES = frozenset(('linear', 'lin'))
+LOG_NORM_NAMES = frozenset(('logarithmic', 'logarithic', 'logarithm', 'log', 'log10'))
 
 
 def plot(*, x: ndarray, y: ndarray, ax: Any, **kwargs):
@@ -23,7 +30,9 @@ def plot(*, x: ndarray, y: ndarray, ax: Any, **kwargs):
     ax
         A matplotlib Axes handle.
     **kwargs
-        Keyword arguments to pass to ax.plot method.
+        Keyword arguments to pass to ax.plot method. The lines are
+        rasterized if there are more than RASTERIZE_THRESHOLD
+        particles, unless rasterized is set.
 
     Returns
     -------
@@ -33,6 +42,7 @@ def plot(*, x: ndarray, y: ndarray, ax: Any, **kwargs):
     _kwargs = copy(kwargs)
     linestyle = _kwargs.pop('linestyle', '')
     marker = _kwargs.pop('marker', '.')
+    _kwargs.setdefault('rasterized', np.size(x) > RASTERIZE_THRESHOLD)
     return ax.plot(x, y, linestyle=linestyle, marker=marker, **_kwargs)
 
 
@@ -60,13 +70,17 @@ def scatter(
     s
         The quantity to set the particle size.
     n_samples
-        The number of samples to take. Default is 10,000.
+        The maximum number of particles to plot. If there are more
+        particles, a random sample of this size is plotted. Default is
+        10,000.
     random_seed
         The random seed for sampling. Default is None.
     ax
         A matplotlib Axes handle.
     **kwargs
-        Keyword arguments to pass to ax.scatter method.
+        Keyword arguments to pass to ax.scatter method. The paths are
+        rasterized if there are more than RASTERIZE_THRESHOLD
+        particles, unless rasterized is set.
 
     Returns
     -------
@@ -77,20 +91,23 @@ def scatter(
         raise ValueError('Should set size or color')
     if n_samples > 100_000:
         logger.warning('n_samples > 100,000: this may be slow')
-    if random_seed is not None:
-        np.random.seed(random_seed)
 
-    rand = np.random.choice(len(x), n_samples)
+    # Only sub-sample if there are more particles than samples, and draw
+    # each particle at most once
+    if len(x) > n_samples:
+        rng = np.random.default_rng(random_seed)
+        rand = rng.choice(len(x), n_samples, replace=False)
 
-    x = x[rand]
-    y = y[rand]
-    if c is not None:
-        c = c[rand]
-    if s is not None:
-        s = s[rand]
+        x = x[rand]
+        y = y[rand]
+        if c is not None:
+            c = c[rand]
+        if s is not None:
+            s = s[rand]
 
     _kwargs = copy(kwargs)
     alpha = _kwargs.pop('alpha', 0.5)
+    _kwargs.setdefault('rasterized', np.size(x) > RASTERIZE_THRESHOLD)
 
     return ax.scatter(x, y, c=c, s=s, alpha=alpha, **_kwargs)
 
@@ -107,7 +124,10 @@ def imshow(*, interpolated_data: ndarray, extent: Extent, ax: Any, **kwargs):
     ax
         A matplotlib Axes handle.
     **kwargs
-        Keyword arguments to pass to ax.imshow method.
+        Keyword arguments to pass to ax.imshow method. The norm can be
+        'linear' or 'log', or a matplotlib Normalize object which is
+        used as is. Similarly, the cmap can be a name or a Colormap
+        object, e.g. to re-use them across many images.
 
     Returns
     -------
@@ -115,17 +135,21 @@ def imshow(*, interpolated_data: ndarray, extent: Extent, ax: Any, **kwargs):
         A matplotlib AxesImage object.
     """
     _kwargs = copy(kwargs)
-    try:
-        norm = _kwargs.pop('norm')
-    except KeyError:
-        norm = 'linear'
-    if norm.lower() in ('linear', 'lin'):
-        norm = mpl.colors.Normalize()
-    elif norm.lower() in ('logarithic', 'logarithm', 'log', 'log10'):
-        norm = mpl.colors.LogNorm()
-    else:
+    norm = _kwargs.pop('norm', 'linear')
+    if isinstance(norm, str):
+        name = norm.lower()
+        if name in LINEAR_NORM_NAMES:
+            norm = mpl.colors.Normalize()
+        elif name in LOG_NORM_NAMES:
+            norm = mpl.colors.LogNorm()
+        else:
+            raise ValueError('Cannot determine normalization for colorbar')
+    elif not isinstance(norm, mpl.colors.Normalize):
         raise ValueError('Cannot determine normalization for colorbar')
 
+    # Matplotlib resamples and normalizes float32 data in single precision
+    interpolated_data = _to_float32(interpolated_data)
+
     return ax.imshow(
         interpolated_data, origin='lower', extent=extent, norm=norm, **_kwargs
     )
@@ -143,17 +167,18 @@ def contour(*, interpolated_data: ndarray, extent: Extent, ax: Any, **kwargs):
     ax
         A matplotlib Axes handle.
     **kwargs
-        Keyword arguments to pass to ax.imshow method.
+        Keyword arguments to pass to ax.contour method.
 
     Returns
     -------
     contour
         A matplotlib QuadContourSet object.
     """
-    n_interp_x, n_interp_y = interpolated_data.shape
-    X, Y = np.meshgrid(
-        np.linspace(*extent[:2], n_interp_x), np.linspace(*extent[2:], n_interp_y),
-    )
+    # Rows of the data are along y, and columns along x; contour accepts 1d
+    # coordinates for a rectilinear grid
+    n_interp_y, n_interp_x = interpolated_data.shape
+    X = np.linspace(*extent[:2], n_interp_x)
+    Y = np.linspace(*extent[2:], n_interp_y)
 
     return ax.contour(X, Y, interpolated_data, **kwargs)
 
@@ -170,38 +195,47 @@ def quiver(*, interpolated_data: ndarray, extent: Extent, ax: Any, **kwargs):
     ax
         A matplotlib Axes handle.
     **kwargs
-        Keyword arguments to pass to ax.imshow method.
+        Keyword arguments to pass to ax.quiver method. The arrows are
+        rasterized if there are more than RASTERIZE_THRESHOLD arrows,
+        unless rasterized is set.
 
     Returns
     -------
     quiver
         A matplotlib Quiver object.
     """
-    n_interp_x, n_interp_y = interpolated_data[0].shape
-    X, Y = np.meshgrid(
-        np.linspace(*extent[:2], n_interp_x), np.linspace(*extent[2:], n_interp_y)
-    )
+    n_interp_y, n_interp_x = interpolated_data[0].shape
     U, V = interpolated_data[0], interpolated_data[1]
 
     _kwargs = copy(kwargs)
     number_of_arrows = _kwargs.pop('number_of_arrows', (25, 25))
     normalize_vectors = _kwargs.pop('normalize_vectors', False)
 
+    # Only the sub-sampled coordinates are required, and quiver accepts
+    # 1d coordinates on a rectilinear grid
     n_x, n_y = number_of_arrows[0], number_of_arrows[1]
     stride_x = int(n_interp_x / n_x)
     stride_y = int(n_interp_y / n_y)
-    X = X[::stride_y, ::stride_x]
-    Y = Y[::stride_y, ::stride_x]
-    U = U[::stride_y, ::stride_x]
-    V = V[::stride_y, ::stride_x]
+    X = np.linspace(*extent[:2], n_interp_x)[::stride_x]
+    Y = np.linspace(*extent[2:], n_interp_y)[::stride_y]
+    # Contiguous copies of the sub-sampled vectors, so normalizing them in
+    # place does not modify interpolated_data
+    U = np.array(U[::stride_y, ::stride_x], order='C')
+    V = np.array(V[::stride_y, ::stride_x], order='C')
     if normalize_vectors:
-        norm = np.hypot(U, V)
-        U /= norm
-        V /= norm
+        _normalize_vectors(U, V)
+    _kwargs.setdefault('rasterized', U.size > RASTERIZE_THRESHOLD)
 
     return ax.quiver(X, Y, U, V, **_kwargs)
 
 
+def _normalize_vectors(U, V):
+    # Normalize in place, leaving zero vectors as zero
+    norm = np.hypot(U, V)
+    np.divide(U, norm, out=U, where=norm > 0)
+    np.divide(V, norm, out=V, where=norm > 0)
+
+
 def streamplot(*, interpolated_data: ndarray, extent: Extent, ax: Any, **kwargs):
     """Plot 2d interpolated data as a stream plot.
 
@@ -221,10 +255,9 @@ def streamplot(*, interpolated_data: ndarray, extent: Extent, ax: Any, **kwargs)
     streamplot
         A matplotlib StreamplotSet object.
     """
-    n_interp_x, n_interp_y = interpolated_data[0].shape
-    X, Y = np.meshgrid(
-        np.linspace(*extent[:2], n_interp_x), np.linspace(*extent[2:], n_interp_y)
-    )
+    n_interp_y, n_interp_x = interpolated_data[0].shape
+    X = np.linspace(*extent[:2], n_interp_x)
+    Y = np.linspace(*extent[2:], n_interp_y)
     U, V = interpolated_data[0], interpolated_data[1]
 
     return ax.streamplot(X, Y, U, V, **kwargs)
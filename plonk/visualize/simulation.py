@@ -2,20 +2,34 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, NamedTuple, Tuple
 
+import matplotlib as mpl
 import matplotlib.pyplot as plt
 import numpy as np
 from numpy import ndarray
 
 from .._logging import logger
-from .visualization import image, plot, vector
+from .interpolation import _to_float32
+from .visualization import _interpolated_data, _set_limits, image, plot, vector
 
 if TYPE_CHECKING:
     from ..simulation.simulation import Simulation
 
 KINDS = {'image': image, 'particle': plot, 'vector': vector}
 
+# The number of interpolated images to keep for re-visiting snaps
+IMAGE_CACHE_SIZE = 8
+
+
+class _CachedImage(NamedTuple):
+    # An interpolated image of a snap, and the state of the snap it was
+    # interpolated from
+    interpolated_data: ndarray
+    extent: Any
+    state: Tuple[Any, ...]
+
 
 class VisualizeSimulation:
     """Visualize a simulation.
@@ -30,6 +44,16 @@ class VisualizeSimulation:
     **kwargs
         Keyword arguments to pass to the plot method.
 
+    Notes
+    -----
+    For image plots, the interpolated data of the last IMAGE_CACHE_SIZE
+    snaps visited is kept, so going back to them does not interpolate
+    again. It is re-interpolated if the snap is replaced, rotated,
+    translated, or its units are changed; call clear_cache after other
+    changes to the snaps, e.g. setting an array. Setting particle_ids
+    clears it. The interpolation options are read from kwargs once,
+    when the object is created.
+
     Examples
     --------
     Visualize a simulation by density projection images.
@@ -65,6 +89,10 @@ class VisualizeSimulation:
         self._len = -1
         self._where = 0
         self._no_new_arrays = True
+        self._images: OrderedDict[int, _CachedImage] = OrderedDict()
+        if kind == 'image':
+            self._interpolation_kwargs = _interpolation_kwargs(kwargs)
+        self._autoscale = ('vmin' not in kwargs, 'vmax' not in kwargs)
 
         self._plotting_function(kind=self.kind, idx=0)
 
@@ -83,6 +111,7 @@ class VisualizeSimulation:
         subsnaps = [snap[value] for snap in self.snaps]
         self.snaps = subsnaps
         self._particle_ids = value
+        self.clear_cache()
 
     @property
     def no_new_arrays(self):
@@ -96,53 +125,111 @@ class VisualizeSimulation:
         raise ValueError('no_new_arrays must be True or False')
 
     def _plotting_function(self, kind: str, idx: int):
-        if self.ax is None:
-            _, self.ax = plt.subplots()
-        try:
-            im = self.ax.images[0]
-            cbar = im.colorbar
-            cbar.remove()
-        except (IndexError, AttributeError):
-            pass
-        self.ax.clear()
-
         snap = self.snaps[idx]
         loaded = set(snap.loaded_arrays())
 
-        KINDS[kind](snap=snap, ax=self.ax, **self.kwargs)  # type: ignore
+        if kind == 'image' and self.ax is not None and self.ax.images:
+            # Update the existing image, and its colorbar, in place
+            self._update_image(idx=idx, image=self.ax.images[0])
+        else:
+            if self.ax is None:
+                _, self.ax = plt.subplots()
+            try:
+                im = self.ax.images[0]
+                cbar = im.colorbar
+                cbar.remove()
+            except (IndexError, AttributeError):
+                pass
+            self.ax.clear()
+
+            KINDS[kind](snap=snap, ax=self.ax, **self.kwargs)  # type: ignore
+            if kind == 'image' and self.ax.images:
+                image = self.ax.images[0]
+                self._cache_image(idx, image.get_array(), image.get_extent())
 
         new_arrays = set(snap.loaded_arrays()).symmetric_difference(loaded)
         if self._no_new_arrays:
             for array in new_arrays:
                 del snap[array]
 
+        # Let interactive backends redraw the canvas once the new plot is
+        # complete
+        self.ax.figure.canvas.draw_idle()
+
+    def _update_image(self, idx, image):
+        cached = self._images.get(idx)
+        if cached is not None and cached.state == _snap_state(self.snaps[idx]):
+            self._images.move_to_end(idx)
+            interpolated_data, extent = cached.interpolated_data, cached.extent
+        else:
+            interpolated_data, extent = self._interpolate_image(idx)
+            # As plonk.image, pass float32 to imshow; it also halves the
+            # memory of the cached images
+            interpolated_data = _to_float32(interpolated_data)
+            self._cache_image(idx, interpolated_data, extent)
+        image.set_data(interpolated_data)
+        image.set_extent(extent)
+        _set_limits(ax=self.ax, extent=extent)
+
+        # Autoscale the color limits not set by the user, as for a new image,
+        # without creating another instance of the image norm
+        data = image.get_array()
+        if isinstance(image.norm, mpl.colors.LogNorm):
+            data = np.ma.masked_less_equal(data, 0, copy=False)
+        norm = mpl.colors.Normalize()
+        norm.autoscale_None(data)
+        vmin, vmax = image.get_clim()
+        if self._autoscale[0]:
+            vmin = norm.vmin
+        if self._autoscale[1]:
+            vmax = norm.vmax
+        image.set_clim(vmin, vmax)
+
+    def _interpolate_image(self, idx):
+        interpolated_data, extent, _ = _interpolated_data(
+            snap=self.snaps[idx], **self._interpolation_kwargs
+        )
+        return interpolated_data, extent
+
+    def _cache_image(self, idx, interpolated_data, extent):
+        state = _snap_state(self.snaps[idx])
+        self._images[idx] = _CachedImage(interpolated_data, extent, state)
+        self._images.move_to_end(idx)
+        if len(self._images) > IMAGE_CACHE_SIZE:
+            self._images.popitem(last=False)
+
+    def clear_cache(self):
+        """Clear the cached interpolated images."""
+        self._images.clear()
+
+    def _goto(self, idx: int):
+        self._plotting_function(kind=self.kind, idx=idx)
+        self._where = idx
+
     def next(self, number: int = 1):
         """Visualize next snap."""
         idx = self._where + number
-        if idx < len(self):
-            self._plotting_function(kind=self.kind, idx=idx)
-            self._where += number
-        else:
+        if idx > len(self) - 1:
             logger.info('Too far forward. Going to last snap.')
-            self._plotting_function(kind=self.kind, idx=len(self) - 1)
-            self._where = len(self) - 1
+            idx = len(self) - 1
+        # Do not re-plot if already at the last snap
+        if idx != self._where:
+            self._goto(idx)
 
     def prev(self, number: int = 1):
         """Visualize previous snap."""
         idx = self._where - number
-        if idx > 0:
-            self._plotting_function(kind=self.kind, idx=idx)
-            self._where -= number
-        else:
+        if idx < 0:
             logger.info('Too far back. Going to first snap.')
-            self._plotting_function(kind=self.kind, idx=0)
-            self._where = 0
+            idx = 0
+        # Do not re-plot if already at the first snap
+        if idx != self._where:
+            self._goto(idx)
 
     def goto(self, idx: int):
         """Visualize particular snap by index."""
-        if -len(self) < idx < len(self) - 1:
-            self._plotting_function(kind=self.kind, idx=idx)
-            self._where = np.mod(idx, len(self))
+        if -len(self) <= idx < len(self):
+            self._goto(np.mod(idx, len(self)))
         else:
             raise ValueError('out of range')
 
@@ -158,6 +245,39 @@ class VisualizeSimulation:
         return self._len
 
 
+def _snap_state(snap) -> Tuple[Any, ...]:
+    """The snap attributes that the interpolated image depends on."""
+    rotation, translation = snap._rotation_matrix, snap.translation
+    return (
+        id(snap),
+        None if rotation is None else rotation.tobytes(),
+        None if translation is None else translation.magnitude.tobytes(),
+        tuple(sorted(snap._default_units.items())),
+    )
+
+
+def _interpolation_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Get the interpolation options of image plot kwargs."""
+    if 'quantity' not in kwargs:
+        raise ValueError('image plots require a quantity')
+    interp = kwargs.get('interp', 'projection')
+    if interp not in ('projection', 'slice'):
+        raise ValueError('interp must be "projection" or "slice"')
+    return {
+        'quantity': kwargs['quantity'],
+        'x': kwargs.get('x', 'x'),
+        'y': kwargs.get('y', 'y'),
+        'interp': interp,
+        'weighted': kwargs.get('weighted', False),
+        'slice_normal': kwargs.get('slice_normal'),
+        'slice_offset': kwargs.get('slice_offset'),
+        'extent': kwargs.get('extent'),
+        'units': kwargs.get('units'),
+        'num_pixels': kwargs.get('num_pixels'),
+        'dtype': kwargs.get('dtype', np.float32),
+    }
+
+
 def visualize_sim(sim: Simulation, kind: str, **kwargs) -> VisualizeSimulation:
     """Visualize a simulation.
 
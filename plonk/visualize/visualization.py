@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import math
 from contextlib import suppress
 from copy import copy
-from typing import TYPE_CHECKING, Any, Dict, Sequence, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, NamedTuple, Sequence, Tuple, Union
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -15,7 +16,7 @@ from .._logging import logger
 from .._units import Quantity
 from .._units import units as plonk_units
 from ..utils.strings import pretty_array_name
-from ..utils.visualize import get_extent_from_percentile
+from ..utils.visualize import get_coordinates, get_extent_from_percentile
 from . import plots
 from .interpolation import interpolate
 
@@ -30,6 +31,21 @@ _kind_to_function = {
 }
 
 
+class _ImageUnits(NamedTuple):
+    # Units of an interpolated image
+    quantity: Any
+    extent: Any
+    projection: Any
+
+
+class _PlotUnits(NamedTuple):
+    # Units of a particle plot
+    x: Any
+    y: Any
+    c: Any
+    s: Any
+
+
 def image(
     snap: SnapLike,
     quantity: str,
@@ -95,7 +111,9 @@ def image(
     ax_kwargs
         Keyword arguments to pass to matplotlib Axes.
     colorbar_kwargs
-        Keyword arguments to pass to matplotlib Colorbar.
+        Keyword arguments to pass to matplotlib Colorbar. Pass 'cax' to
+        draw the colorbar on an existing Axes, e.g. one shared between
+        plots, instead of appending a new one.
     **kwargs
         Additional keyword arguments to pass to interpolation and
         matplotlib functions.
@@ -121,6 +139,10 @@ def image(
     num_pixels : tuple
         The number of pixels to interpolate particle quantities
         to as a tuple (nx, ny). Default is (512, 512).
+    dtype : type
+        The float type of the particle arrays passed to the
+        interpolation kernels. Default is np.float32; set to
+        np.float64 for double precision.
     show_colorbar : bool
         Whether or not to display a colorbar. Default is True.
 
@@ -249,6 +271,10 @@ def vector(
     num_pixels : tuple
         The number of pixels to interpolate particle quantities
         to as a tuple (nx, ny). Default is (512, 512).
+    dtype : type
+        The float type of the particle arrays passed to the
+        interpolation kernels. Default is np.float32; set to
+        np.float64 for double precision.
     number_of_arrows : tuple
         The number of arrows to display by sub-sampling the
         interpolated data. Default is (25, 25).
@@ -338,6 +364,7 @@ def _interpolation_plot(
 
     # Interpolate data to plot
     num_pixels = _kwargs.pop('num_pixels', None)
+    dtype = _kwargs.pop('dtype', np.float32)
     _data, _extent, _units = _interpolated_data(
         snap=snap,
         quantity=quantity,
@@ -350,6 +377,7 @@ def _interpolation_plot(
         extent=extent,
         units=units,
         num_pixels=num_pixels,
+        dtype=dtype,
     )
 
     # Make the actual plot
@@ -383,17 +411,18 @@ def _interpolated_data(
     extent,
     units,
     num_pixels,
+    dtype,
 ):
-    units = {
-        'quantity': _get_unit(snap, quantity, units),
-        'extent': _get_unit(snap, 'position', units),
-        'projection': _get_unit(snap, 'projection', units),
-    }
+    units = _ImageUnits(
+        quantity=_get_unit(snap, quantity, units),
+        extent=_get_unit(snap, 'position', units),
+        projection=_get_unit(snap, 'projection', units),
+    )
 
     if extent is None:
         extent = get_extent_from_percentile(snap=snap, x=x, y=y)
     if not isinstance(extent[0], Quantity):
-        extent = np.array(extent) * units['extent']
+        extent = np.array(extent) * units.extent
     else:
         if isinstance(extent, (tuple, list)):
             extent = np.array([e.magnitude for e in extent]) * extent[0].units
@@ -410,16 +439,17 @@ def _interpolated_data(
         slice_offset=slice_offset,
         extent=extent,
         num_pixels=num_pixels,
+        dtype=dtype,
     )
 
     # Convert Quantity to ndarray
-    extent = extent.to(units['extent']).magnitude
+    extent = extent.to(units.extent).magnitude
     if interp == 'projection' and not weighted:
         interpolated_data = interpolated_data.to(
-            units['quantity'] * units['projection']
+            units.quantity * units.projection
         ).magnitude
     else:
-        interpolated_data = interpolated_data.to(units['quantity']).magnitude
+        interpolated_data = interpolated_data.to(units.quantity).magnitude
 
     return interpolated_data, extent, units
 
@@ -456,37 +486,29 @@ def _interpolated_plot(
     ax.set_xlim(*extent[:2])
     ax.set_ylim(*extent[2:])
 
-    eunit = units['extent']
-    if np.allclose(eunit.magnitude, 1.0):
+    eunit = units.extent
+    if math.isclose(eunit.magnitude, 1.0):
         eunit = eunit.units
     xname, yname = pretty_array_name(names["x"]), pretty_array_name(names["y"])
     ax.set_xlabel(f'{xname} [{eunit:~P}]')
     ax.set_ylabel(f'{yname} [{eunit:~P}]')
 
-    ratio = (extent[1] - extent[0]) / (extent[3] - extent[2])
-    if not max(ratio, 1 / ratio) > 10.0:
-        ax.set_aspect('equal')
+    _set_aspect(ax=ax, extent=extent)
 
     ax.set(**ax_kwargs)
 
     if show_colorbar:
-        divider = make_axes_locatable(ax)
-        _kwargs = copy(colorbar_kwargs)
-        position = _kwargs.pop('position', 'right')
-        size = _kwargs.pop('size', '5%')
-        pad = _kwargs.pop('pad', '2%')
-        if position in ('top', 'bottom'):
-            _kwargs.update({'orientation': 'horizontal'})
-        cax = divider.append_axes(position=position, size=size, pad=pad)
-        cbar = fig.colorbar(plot_object, cax, **_kwargs)
+        cbar = _colorbar(
+            plot_object=plot_object, ax=ax, fig=fig, colorbar_kwargs=colorbar_kwargs
+        )
 
         qname = pretty_array_name(names["quantity"])
         if interp == 'projection' and not weighted:
             qname = 'Integrated ' + qname[0].lower() + qname[1:]
-            qunit = units['quantity'] * units['projection']
+            qunit = units.quantity * units.projection
         else:
-            qunit = units['quantity']
-        if np.allclose(qunit.magnitude, 1.0):
+            qunit = units.quantity
+        if math.isclose(qunit.magnitude, 1.0):
             qunit = qunit.units
         qlabel = qname
         if f'{qunit:~P}' != '':
@@ -546,7 +568,9 @@ def plot(
     ax_kwargs
         Keyword arguments to pass to matplotlib Axes.
     colorbar_kwargs
-        Keyword arguments to pass to matplotlib Colorbar.
+        Keyword arguments to pass to matplotlib Colorbar. Pass 'cax' to
+        draw the colorbar on an existing Axes, e.g. one shared between
+        plots, instead of appending a new one.
     **kwargs
         Additional keyword arguments to pass to matplotlib
         functions.
@@ -623,6 +647,7 @@ def _plot(
         # The subsnaps list is just a list with the original snap
         subsnaps = [snap]
 
+    extent = [np.inf, -np.inf, np.inf, -np.inf]
     for subsnap in subsnaps:
         _x, _y, _c, _s, _units = _plot_data(
             snap=subsnap, x=x, y=y, c=c, s=s, units=units
@@ -633,49 +658,65 @@ def _plot(
             c=_c,
             s=_s,
             units=_units,
-            xlim=xlim,
-            ylim=ylim,
             names={'x': x, 'y': y, 'c': c, 's': s},
             fig=fig,
             ax=ax,
-            ax_kwargs=ax_kwargs,
             colorbar_kwargs=colorbar_kwargs,
             **_kwargs,
         )
+        if np.size(_x) > 0:
+            extent = [
+                min(extent[0], np.min(_x)),
+                max(extent[1], np.max(_x)),
+                min(extent[2], np.min(_y)),
+                max(extent[3], np.max(_y)),
+            ]
+
+    # Decorate the Axes once for all the sub-snaps
+    if subsnaps:
+        _plot_axes(
+            extent=extent,
+            units=_units,
+            xlim=xlim,
+            ylim=ylim,
+            names={'x': x, 'y': y},
+            ax=ax,
+            ax_kwargs=ax_kwargs,
+        )
 
     return ax
 
 
 def _plot_data(snap, x, y, c, s, units):
-    _x: Quantity = snap[x]
-    _y: Quantity = snap[y]
+    _x, _y = get_coordinates(snap=snap, x=x, y=y)
     _c: Quantity = snap[c] if c is not None else None
     _s: Quantity = snap[s] if s is not None else None
 
-    _units = {
-        'x': _get_unit(snap, x, units),
-        'y': _get_unit(snap, y, units),
-        'c': _get_unit(snap, c, units),
-        's': _get_unit(snap, s, units),
-    }
+    _units = _PlotUnits(
+        x=_get_unit(snap, x, units),
+        y=_get_unit(snap, y, units),
+        c=_get_unit(snap, c, units),
+        s=_get_unit(snap, s, units),
+    )
 
-    _x = _x.to(_units['x']).magnitude
-    _y = _y.to(_units['y']).magnitude
+    _x = _x.to(_units.x).magnitude
+    _y = _y.to(_units.y).magnitude
     if _c is not None:
-        _c = _c.to(_units['c']).magnitude
+        _c = _c.to(_units.c).magnitude
     if _s is not None:
-        _s = _s.to(_units['s']).magnitude
+        _s = _s.to(_units.s).magnitude
 
     try:
         # ignore accreted particles
         h: ndarray = snap['smoothing_length'].m
         mask = h > 0
-        _x = _x[mask]
-        _y = _y[mask]
-        if _c is not None:
-            _c = _c[mask]
-        if _s is not None:
-            _s = _s[mask]
+        if not mask.all():
+            _x = _x[mask]
+            _y = _y[mask]
+            if _c is not None:
+                _c = _c[mask]
+            if _s is not None:
+                _s = _s[mask]
     except KeyError:
         # sink particles do not have smoothing length
         pass
@@ -686,9 +727,7 @@ def _plot_data(snap, x, y, c, s, units):
     return _x, _y, _c, _s, _units
 
 
-def _plot_plot(
-    x, y, c, s, units, xlim, ylim, names, fig, ax, ax_kwargs, colorbar_kwargs, **kwargs,
-):
+def _plot_plot(x, y, c, s, units, names, fig, ax, colorbar_kwargs, **kwargs):
     show_colorbar = kwargs.pop('show_colorbar', c is not None)
 
     if s is None and c is None:
@@ -696,14 +735,43 @@ def _plot_plot(
     else:
         plot_object = plots.scatter(x=x, y=y, c=c, s=s, ax=ax, **kwargs)
 
-    ratio = (x.max() - x.min()) / (y.max() - y.min())
-    if not max(ratio, 1 / ratio) > 10.0:
-        ax.set_aspect('equal')
+    if show_colorbar:
+        cbar = _colorbar(
+            plot_object=plot_object, ax=ax, fig=fig, colorbar_kwargs=colorbar_kwargs
+        )
+
+        cunit = units.c
+        if math.isclose(cunit.magnitude, 1.0):
+            cunit = cunit.units
+        cname = pretty_array_name(names["c"])
+        cbar.set_label(f'{cname} [{cunit:~P}]')
+
+
+def _colorbar(plot_object, ax, fig, colorbar_kwargs):
+    _kwargs = copy(colorbar_kwargs)
+    position = _kwargs.pop('position', 'right')
+    size = _kwargs.pop('size', '5%')
+    pad = _kwargs.pop('pad', '2%')
+    if position in ('top', 'bottom'):
+        _kwargs.update({'orientation': 'horizontal'})
+    # Draw on a colorbar Axes passed in, e.g. shared between plots, rather
+    # than appending a new one
+    cax = _kwargs.pop('cax', None)
+    if cax is None:
+        divider = make_axes_locatable(ax)
+        cax = divider.append_axes(position=position, size=size, pad=pad)
+    else:
+        cax.clear()
+    return fig.colorbar(plot_object, cax, **_kwargs)
+
 
-    xunit, yunit = units['x'], units['y']
-    if np.allclose(xunit.magnitude, 1.0):
+def _plot_axes(extent, units, xlim, ylim, names, ax, ax_kwargs):
+    _set_aspect(ax=ax, extent=extent)
+
+    xunit, yunit = units.x, units.y
+    if math.isclose(xunit.magnitude, 1.0):
         xunit = xunit.units
-    if np.allclose(yunit.magnitude, 1.0):
+    if math.isclose(yunit.magnitude, 1.0):
         yunit = yunit.units
     xname, yname = pretty_array_name(names["x"]), pretty_array_name(names["y"])
     ax.set_xlabel(f'{xname} [{xunit:~P}]')
@@ -724,29 +792,30 @@ def _plot_plot(
             _ylim = ylim.to(yunit)
         ax.set_ylim(_ylim.magnitude)
 
-    if show_colorbar:
-        divider = make_axes_locatable(ax)
-        _kwargs = copy(colorbar_kwargs)
-        position = _kwargs.pop('position', 'right')
-        size = _kwargs.pop('size', '5%')
-        pad = _kwargs.pop('pad', '2%')
-        if position in ('top', 'bottom'):
-            _kwargs.update({'orientation': 'horizontal'})
-        cax = divider.append_axes(position=position, size=size, pad=pad)
-        cbar = fig.colorbar(plot_object, cax, **_kwargs)
 
-        cunit = units['c']
-        if np.allclose(cunit.magnitude, 1.0):
-            cunit = cunit.units
-        cname = pretty_array_name(names["c"])
-        cbar.set_label(f'{cname} [{cunit:~P}]')
+def _set_limits(ax, extent):
+    # Set the Axes limits to the extent, unless they already are, e.g. when
+    # updating an image with the same extent in an animation
+    if tuple(ax.get_xlim()) != tuple(extent[:2]):
+        ax.set_xlim(*extent[:2])
+    if tuple(ax.get_ylim()) != tuple(extent[2:]):
+        ax.set_ylim(*extent[2:])
+
+
+def _set_aspect(ax, extent):
+    # Set equal aspect unless the plot is too elongated, or it already is
+    ratio = (extent[1] - extent[0]) / (extent[3] - extent[2])
+    if not np.isfinite(ratio) or max(ratio, 1 / ratio) > 10.0:
+        return
+    if ax.get_aspect() not in ('equal', 1.0):
+        ax.set_aspect('equal')
 
 
 def _convert_units_for_cmap(vm, name, units, interp, weighted):
     if interp == 'projection' and not weighted:
-        quantity_unit = units['quantity'] * units['projection']
+        quantity_unit = units.quantity * units.projection
     else:
-        quantity_unit = units['quantity']
+        quantity_unit = units.quantity
     if vm is not None:
         if isinstance(vm, Quantity):
             if vm.dimensionality != quantity_unit.dimensionality:
@@ -770,8 +839,8 @@ def _get_unit(snap, name, units):
             return 1 * plonk_units(units[name])
         if base_name in units:
             return 1 * plonk_units(units[base_name])
-    if base_name in snap.default_units:
-        return 1 * plonk_units(snap.default_units[base_name])
+    if base_name in snap._default_units:
+        return 1 * plonk_units(snap._default_units[base_name])
     if name == 'projection':
         return 1 * snap['position'].units
     return 1 * snap[base_name].units
@@ -2,7 +2,13 @@
 
 import numpy as np
 
-from plonk.visualize.interpolation import scalar_interpolation, vector_interpolation
+from plonk.visualize.interpolation import (
+    _interpolation_weights,
+    _kernel_arrays,
+    _to_float32,
+    scalar_interpolation,
+    vector_interpolation,
+)
 
 from .data.interpolation_arrays import (
     scalar_projection,
@@ -96,3 +102,110 @@ def test_vector_interpolation_slice():
     )
 
     np.testing.assert_allclose(vec, vector_slice, rtol=1e-5)
+
+
+def test_vector_interpolation_components():
+    """Test vector interpolation matches interpolating each component."""
+    rng = np.random.default_rng(42)
+    n = 1000
+    xx, yy, zz = rng.random((3, n))
+    hh = 0.05 + 0.1 * rng.random(n)
+    mm = np.full(n, 1 / n)
+    qx, qy = rng.normal(size=(2, n))
+
+    for dist_from_slice in (None, zz - ZSLICE):
+        for weighted in (False, True):
+            kwargs = dict(
+                x_coordinate=xx,
+                y_coordinate=yy,
+                dist_from_slice=dist_from_slice,
+                extent=EXTENT,
+                smoothing_length=hh,
+                particle_mass=mm,
+                hfact=HFACT,
+                weighted=weighted,
+                num_pixels=PIX,
+            )
+            vec = vector_interpolation(quantity_x=qx, quantity_y=qy, **kwargs)
+            np.testing.assert_array_equal(
+                vec[0], scalar_interpolation(quantity=qx, **kwargs)
+            )
+            np.testing.assert_array_equal(
+                vec[1], scalar_interpolation(quantity=qy, **kwargs)
+            )
+
+
+def test_interpolation_weights_precision():
+    """Test density weights keep the precision of m / h^3."""
+    hh = np.linspace(0.1, 1.0, N, dtype=np.float32)
+    weight, _ = _interpolation_weights(
+        smoothing_length=hh, particle_mass=MM, hfact=HFACT, weighted=True
+    )
+    assert weight.dtype == np.float64
+    np.testing.assert_array_equal(weight, MM / hh ** 3)
+
+
+def test_interpolation_dtype():
+    """Test interpolation with float32 and float64 kernel inputs."""
+    rng = np.random.default_rng(42)
+    n = 1000
+    xx, yy, zz = rng.random((3, n))
+    hh = 0.05 + 0.1 * rng.random(n)
+    mm = np.full(n, 1 / n)
+    qq = rng.normal(size=n)
+
+    for dist_from_slice in (None, zz - ZSLICE):
+        kwargs = dict(
+            quantity=qq,
+            x_coordinate=xx,
+            y_coordinate=yy,
+            dist_from_slice=dist_from_slice,
+            extent=EXTENT,
+            smoothing_length=hh,
+            particle_mass=mm,
+            hfact=HFACT,
+            num_pixels=PIX,
+        )
+        im32 = scalar_interpolation(dtype=np.float32, **kwargs)
+        im64 = scalar_interpolation(dtype=np.float64, **kwargs)
+        assert im32.dtype == im64.dtype == np.float64
+        np.testing.assert_allclose(im32, im64, atol=1e-3 * np.abs(im64).max())
+
+    # The coordinates are shifted to the extent before casting to float32,
+    # so images far from the origin keep their resolution
+    offset = 1e4
+    kwargs = dict(
+        quantity=qq,
+        x_coordinate=0.1 * xx + offset,
+        y_coordinate=0.1 * yy + offset,
+        extent=(offset, offset + 0.1, offset, offset + 0.1),
+        smoothing_length=np.full(n, 2e-3),
+        particle_mass=mm,
+        hfact=HFACT,
+        num_pixels=PIX,
+    )
+    im32 = scalar_interpolation(dtype=np.float32, **kwargs)
+    im64 = scalar_interpolation(dtype=np.float64, **kwargs)
+    np.testing.assert_allclose(im32, im64, atol=1e-3 * np.abs(im64).max())
+
+    # Values outside the float32 range are not cast
+    x32, big, none = _kernel_arrays(xx, 1e40 * xx, None, dtype=np.float32)
+    assert x32.dtype == np.float32
+    assert big.dtype == np.float64
+    assert none is None
+
+
+def test_to_float32():
+    """Test conversion to float32 only when values are representable."""
+    for data in (
+        np.array([0.0, -1.0, 1e30, np.inf, -np.inf, np.nan]),
+        np.array([[0.0, 1e-30], [-2.0, np.nan]]),
+        np.zeros((3, 1)).T,
+    ):
+        converted = _to_float32(data)
+        assert converted.dtype == np.float32 and converted.flags.c_contiguous
+        np.testing.assert_allclose(converted, data, rtol=1e-7)
+    for data in (np.array([0.0, 1.0, 1e39]), np.array([[0.0, 1.0], [-1e-40, 0.0]])):
+        assert _to_float32(data) is data
+    data = np.ones(3, dtype=np.float32)
+    assert _to_float32(data) is data
@@ -2,10 +2,12 @@
 
 from pathlib import Path
 
+import matplotlib as mpl
 import numpy as np
 import pytest
 
 import plonk
+from plonk.visualize.simulation import VisualizeSimulation
 
 DIR_PATH = Path(__file__).parent / 'data/phantom'
 PREFIX = 'dustseparate'
@@ -58,6 +60,93 @@ def test_simulation_visualization():
     viz.next()
     viz.prev()
 
+    viz.goto(len(viz) - 1)
+    assert viz.index == len(viz) - 1
+    artists = viz.ax.get_children()
+    viz.next()
+    assert viz.index == len(viz) - 1
+    assert viz.ax.get_children() == artists
+    # Going to the current snap re-plots it
+    viz.goto(viz.index)
+    assert viz.ax.get_children() != artists
+    viz.goto(-len(viz))
+    assert viz.index == 0
+    with pytest.raises(ValueError):
+        viz.goto(len(viz))
+
+
+def test_simulation_visualization_image():
+    """Test simulation image visualization updates the image in place."""
+    sim = plonk.load_simulation(prefix=PREFIX, directory=DIR_PATH)
+
+    viz = sim.visualize(kind='image', quantity='density', num_pixels=(16, 16))
+    image = viz.ax.images[0]
+    colorbar = image.colorbar
+
+    subsnap = viz.snaps[0][: len(viz.snaps[0]) // 2]
+    viz.snaps = [viz.snaps[0], subsnap]
+    viz.next()
+    assert len(viz.ax.images) == 1
+    assert viz.ax.images[0] is image
+    assert image.colorbar is colorbar
+    assert image.get_array().dtype == np.float32
+
+    ax = plonk.image(snap=subsnap, quantity='density', num_pixels=(16, 16))
+    np.testing.assert_allclose(image.get_array(), ax.images[0].get_array())
+    np.testing.assert_allclose(image.get_clim(), ax.images[0].get_clim())
+
+    # Re-visited snaps use the cached interpolated data
+    assert list(viz._images) == [0, 1]
+    data = viz._images[0].interpolated_data
+    viz._interpolate_image = None
+    viz.prev()
+    np.testing.assert_array_equal(image.get_array(), data)
+    viz.next()
+    np.testing.assert_allclose(image.get_array(), ax.images[0].get_array())
+
+    # Changing a snap re-interpolates its image
+    viz._interpolate_image = VisualizeSimulation._interpolate_image.__get__(viz)
+    for change in (
+        lambda snap: snap.rotate(axis=(1, 0, 0), angle=np.pi / 2),
+        lambda snap: snap.translate(translation=(1, 0, 0), unit='au'),
+        lambda snap: snap.set_units(density='kg/m^3'),
+    ):
+        change(viz.snaps[0])
+        viz.prev()
+        ax = plonk.image(snap=viz.snaps[0], quantity='density', num_pixels=(16, 16))
+        np.testing.assert_allclose(image.get_array(), ax.images[0].get_array())
+        viz.next()
+    viz.snaps = [subsnap, subsnap]
+    viz.prev()
+    assert viz._images[0].interpolated_data is not data
+    viz.clear_cache()
+    assert not viz._images
+
+    with pytest.raises(ValueError):
+        sim.visualize(kind='image', quantity='density', interp='not_available')
+    with pytest.raises(ValueError):
+        sim.visualize(kind='image')
+
+
+def test_simulation_visualization_image_norm():
+    """Test simulation image visualization with a matplotlib norm."""
+    sim = plonk.load_simulation(prefix=PREFIX, directory=DIR_PATH)
+
+    norm = mpl.colors.LogNorm()
+    viz = sim.visualize(
+        kind='image', quantity='density', num_pixels=(16, 16), norm=norm
+    )
+    image = viz.ax.images[0]
+    assert image.norm is norm
+
+    subsnap = viz.snaps[0][: len(viz.snaps[0]) // 2]
+    viz.snaps = [viz.snaps[0], subsnap]
+    viz.next()
+    assert viz.ax.images[0] is image
+    assert image.norm is norm
+    data = image.get_array()
+    np.testing.assert_allclose(image.get_clim(), (data[data > 0].min(), data.max()))
+
 
 def test_to_array():
     """Testing to_array method."""
@@ -68,6 +68,8 @@ def test_read_particle_arrays_from_phantom(snaptype):
         snaptype.mean_array_values,
         snaptype.std_array_values,
     )
+    assert snap['type'].magnitude.dtype == np.dtype(int)
+    assert snap['sub_type'].magnitude.dtype == np.int8
     snap.close_file()
 
 
@@ -146,6 +148,10 @@ def test_rotate_snap(snaptype):
     snap['radius_cylindrical']
     if snap.num_sinks > 0:
         snap.sinks['position']
+    loaded_arrays = snap.loaded_arrays()
+    snap.rotate(axis=(1, 2, 3), angle=0)
+    assert snap.rotation is None
+    assert snap.loaded_arrays() == loaded_arrays
     snap.rotate(axis=(1, 2, 3), angle=np.pi)
     snap.rotate(axis=(1, 2, 3), angle=-np.pi)
     _check_arrays(
@@ -189,6 +195,10 @@ def test_translate_snap(snaptype):
     snap['position']
     if snap.num_sinks > 0:
         snap.sinks['position']
+    loaded_arrays = snap.loaded_arrays()
+    snap.translate(translation=(0, 0, 0), unit=unit)
+    assert snap.translation is None
+    assert snap.loaded_arrays() == loaded_arrays
     snap.translate(translation=(100, 200, 300), unit=unit)
     snap.translate(translation=(-100, -200, -300), unit=unit)
     _check_arrays(
@@ -264,6 +274,55 @@ def test_subsnap(snaptype):
     snap.close_file()
 
 
+@pytest.mark.parametrize('snaptype', SNAPTYPES)
+def test_subsnap_cached_arrays(snaptype):
+    """Testing SubSnap arrays are consistent with the base Snap."""
+    filename = DIR / snaptype.filename
+    snap = plonk.load_snap(filename)
+
+    subsnap = snap[0:100]
+    position = subsnap['position']
+    np.testing.assert_allclose(
+        subsnap['position'].m, snap['position'][0:100].m, rtol=RTOL
+    )
+
+    snap.rotate(axis=(1, 0, 0), angle=np.pi / 3)
+    assert not np.allclose(subsnap['position'].m, position.m)
+    np.testing.assert_allclose(
+        subsnap['position'].m, snap['position'][0:100].m, rtol=RTOL
+    )
+
+    # In-place changes to a returned array do not change the SubSnap
+    density = subsnap['density']
+    density.m[:] = 0.0
+    np.testing.assert_allclose(
+        subsnap['density'].m, snap['density'][0:100].m, rtol=RTOL
+    )
+    subsnap['density'].m[:] = 0.0
+    np.testing.assert_allclose(
+        subsnap['density'].m, snap['density'][0:100].m, rtol=RTOL
+    )
+
+    # Contiguous particles are sliced, others are gathered
+    assert subsnap._slice == slice(0, 100)
+    subsnap_every_other = snap[0:200:2]
+    assert subsnap_every_other._slice is None
+    np.testing.assert_allclose(
+        subsnap_every_other['density'].m, snap['density'][0:200:2].m, rtol=RTOL
+    )
+    subsnap_every_other['density'].m[:] = 0.0
+    np.testing.assert_allclose(
+        subsnap_every_other['density'].m, snap['density'][0:200:2].m, rtol=RTOL
+    )
+
+    # Indexed arrays are released with the base Snap arrays
+    assert subsnap._subsnap_arrays
+    snap.reset()
+    assert not subsnap._subsnap_arrays
+
+    snap.close_file()
+
+
 @pytest.mark.parametrize('snaptype', SNAPTYPES)
 def test_sinks(snaptype):
     """Testing getting sink particles."""
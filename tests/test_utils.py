@@ -0,0 +1,115 @@
+"""Testing utils."""
+
+from pathlib import Path
+
+import numpy as np
+from scipy.spatial.transform import Rotation
+
+import plonk
+from plonk.utils.math import rotate_vectors
+from plonk.utils.visualize import (
+    _percentile,
+    cartesian_to_polar,
+    get_coordinates,
+    get_extent_from_percentile,
+)
+
+RTOL = 1e-12
+
+DIR = Path(__file__).parent / 'data/phantom'
+
+
+def test_rotate_vectors():
+    """Test rotating vectors against scipy Rotation.apply."""
+    rng = np.random.default_rng(42)
+    vectors = rng.normal(size=(100, 3))
+
+    # Single rotation
+    rotation = Rotation.from_rotvec([0.3, -1.2, 0.7])
+    np.testing.assert_allclose(
+        rotate_vectors(vectors, rotation), rotation.apply(vectors), rtol=RTOL
+    )
+    np.testing.assert_allclose(
+        rotate_vectors(vectors.astype(np.float32), rotation),
+        rotation.apply(vectors.astype(np.float32)),
+        rtol=1e-6,
+    )
+
+    # Rotation matrix
+    np.testing.assert_allclose(
+        rotate_vectors(vectors, rotation.as_matrix()),
+        rotation.apply(vectors),
+        rtol=RTOL,
+    )
+
+    # Fall back to Rotation.apply for other shapes
+    np.testing.assert_allclose(
+        rotate_vectors(vectors[0], rotation), rotation.apply(vectors[0]), rtol=RTOL
+    )
+    rotation = Rotation.from_rotvec([[0.3, -1.2, 0.7]])
+    np.testing.assert_allclose(
+        rotate_vectors(vectors, rotation), rotation.apply(vectors), rtol=RTOL
+    )
+    rotation = Rotation.from_rotvec(rng.normal(size=(100, 3)))
+    np.testing.assert_allclose(
+        rotate_vectors(vectors, rotation), rotation.apply(vectors), rtol=RTOL
+    )
+
+
+def test_get_coordinates():
+    """Test getting the plot coordinates."""
+    snap = plonk.load_snap(DIR / 'dustseparate_00000.h5')
+    for _snap in (snap, snap[:100], snap.sinks):
+        for x, y in (('x', 'y'), ('position_x', 'z'), ('x', 'mass')):
+            _x, _y = get_coordinates(snap=_snap, x=x, y=y)
+            np.testing.assert_allclose(_x, _snap[x])
+            np.testing.assert_allclose(_y, _snap[y])
+    snap.close_file()
+
+
+def test_percentile():
+    """Test percentiles against np.percentile."""
+    rng = np.random.default_rng(42)
+    for size in (1, 2, 10, 1001):
+        array = rng.normal(size=size)
+        for q in ([0.5, 99.5], [0, 100], [25, 75]):
+            np.testing.assert_array_equal(
+                _percentile(array, q), np.percentile(array, q)
+            )
+    array = rng.normal(size=100) * plonk.units('au')
+    percentile = _percentile(array, [0.5, 99.5])
+    assert percentile.units == array.units
+    np.testing.assert_array_equal(
+        percentile.magnitude, np.percentile(array.magnitude, [0.5, 99.5])
+    )
+
+
+def test_get_extent_from_percentile(monkeypatch):
+    """Test getting the extent by percentile, and from a sample."""
+    snap = plonk.load_snap(DIR / 'dustseparate_00000.h5')
+    x, y = snap['x'].magnitude, snap['y'].magnitude
+    extent = get_extent_from_percentile(snap=snap, x='x', y='y')
+    extent = np.array([e.magnitude for e in extent])
+    np.testing.assert_allclose(extent[:2], np.percentile(x, [0.5, 99.5]))
+    np.testing.assert_allclose(extent[2:], np.percentile(y, [0.5, 99.5]))
+
+    monkeypatch.setattr(plonk.utils.visualize, 'EXTENT_SAMPLE_SIZE', 500)
+    extent_sample = get_extent_from_percentile(snap=snap, x='x', y='y')
+    extent_sample = np.array([e.magnitude for e in extent_sample])
+    np.testing.assert_allclose(extent_sample[:2], np.percentile(x[::4], [0.5, 99.5]))
+    np.testing.assert_allclose(extent_sample, extent, rtol=0.1)
+    snap.close_file()
+
+
+def test_cartesian_to_polar():
+    """Test converting an image to polar coordinates."""
+    yy, xx = np.mgrid[-1:1:64j, -1:1:64j]
+    data = np.exp(-(xx ** 2 + yy ** 2))
+    data_polar, extent_polar = cartesian_to_polar(data, (-1, 1, -1, 1))
+    assert data_polar.shape == data.shape
+    np.testing.assert_allclose(extent_polar, (0, 1, 0, 2 * np.pi))
+    # Axisymmetric data is independent of angle, and decreases with radius
+    np.testing.assert_allclose(
+        data_polar, np.broadcast_to(data_polar[0], data.shape), rtol=1e-2
+    )
+    assert np.all(np.diff(data_polar[0]) < 0)
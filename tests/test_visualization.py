@@ -2,10 +2,16 @@
 
 from pathlib import Path
 
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+import numpy as np
 import pytest
 
 import plonk
 from plonk.utils import visualize
+from plonk.visualize import plots
+from plonk.visualize import visualization as viz
+from plonk.visualize.interpolation import _get_arrays_from_str
 
 from .data.phantom import adiabatic, dustmixture, dustseparate, mhd
 
@@ -19,7 +25,10 @@ def test_plot(snaptype):
     """Test particle plot."""
     filename = DIR / snaptype.filename
     snap = plonk.load_snap(filename)
-    plonk.plot(snap=snap)
+    ax = plonk.plot(snap=snap)
+    assert ax.get_aspect() in ('equal', 1.0)
+    assert ax.get_xlabel().startswith('x [')
+    assert ax.get_ylabel().startswith('y [')
 
     snap.close_file()
 
@@ -40,6 +49,22 @@ def test_plot_with_kwargs(snaptype):
     snap.close_file()
 
 
+@pytest.mark.parametrize('snaptype', SNAPTYPES)
+def test_plot_scatter_samples(snaptype):
+    """Test particle scatter plot sub-sampling."""
+    filename = DIR / snaptype.filename
+    snap = plonk.load_snap(filename)
+
+    ax = plonk.plot(snap=snap, c='density', n_samples=1000)
+    assert len(ax.collections[0].get_offsets()) == 1000
+
+    ax = plonk.plot(snap=snap, c='density', n_samples=len(snap) + 1)
+    num_particles = (snap['smoothing_length'] > 0).sum()
+    assert len(ax.collections[0].get_offsets()) == num_particles
+
+    snap.close_file()
+
+
 @pytest.mark.parametrize('snaptype', SNAPTYPES)
 def test_image_projection(snaptype):
     """Test image projection."""
@@ -50,6 +75,97 @@ def test_image_projection(snaptype):
     snap.close_file()
 
 
+def test_image_shared_colorbar_axes():
+    """Test image plots re-using a colorbar Axes."""
+    snap = plonk.load_snap(DIR / SNAPTYPES[0].filename)
+    fig, (ax, cax) = plt.subplots(ncols=2)
+    for _ in range(2):
+        plonk.image(
+            snap=snap,
+            quantity='density',
+            num_pixels=(16, 16),
+            ax=ax,
+            colorbar_kwargs={'cax': cax},
+        )
+    assert len(fig.axes) == 2
+    assert ax.images[-1].colorbar.ax is cax
+    plt.close(fig)
+
+    snap.close_file()
+
+
+def test_image_dtype(monkeypatch):
+    """Test image plots pass the interpolation dtype."""
+    snap = plonk.load_snap(DIR / SNAPTYPES[0].filename)
+    dtypes = []
+
+    def interpolate(**kwargs):
+        dtypes.append(kwargs['dtype'])
+        return viz_interpolate(**kwargs)
+
+    viz_interpolate = viz.interpolate
+    monkeypatch.setattr(viz, 'interpolate', interpolate)
+    for kwargs in ({}, {'dtype': np.float64}):
+        ax = plonk.image(snap=snap, quantity='density', num_pixels=(16, 16), **kwargs)
+        plt.close(ax.figure)
+    assert dtypes == [np.float32, np.float64]
+
+    snap.close_file()
+
+
+def test_set_limits():
+    """Test Axes limits are only set when they change."""
+    _, ax = plt.subplots()
+    changed = []
+    ax.callbacks.connect('xlim_changed', changed.append)
+    ax.callbacks.connect('ylim_changed', changed.append)
+    viz._set_limits(ax=ax, extent=(0, 2, 0, 3))
+    assert ax.get_xlim() == (0, 2) and ax.get_ylim() == (0, 3)
+    assert len(changed) == 2
+    viz._set_limits(ax=ax, extent=np.array([0.0, 2.0, 0.0, 3.0]))
+    assert len(changed) == 2
+    viz._set_limits(ax=ax, extent=(0, 2, -1, 3))
+    assert ax.get_ylim() == (-1, 3)
+    assert len(changed) == 3
+    plt.close(ax.figure)
+
+
+def test_imshow_norm():
+    """Test imshow with norm names and matplotlib objects."""
+    _, ax = plt.subplots()
+    data = np.linspace(1, 16, 16).reshape(4, 4)
+    for name in ('log', 'LOG', 'logarithmic'):
+        image = plots.imshow(
+            interpolated_data=data, extent=(0, 1, 0, 1), ax=ax, norm=name
+        )
+        assert isinstance(image.norm, mpl.colors.LogNorm)
+    image = plots.imshow(interpolated_data=data, extent=(0, 1, 0, 1), ax=ax, norm='Lin')
+    assert type(image.norm) is mpl.colors.Normalize
+    norm, cmap = mpl.colors.LogNorm(), plt.get_cmap('viridis')
+    for _ in range(2):
+        image = plots.imshow(
+            interpolated_data=data, extent=(0, 1, 0, 1), ax=ax, norm=norm, cmap=cmap
+        )
+        assert image.norm is norm and image.cmap is cmap
+    for norm in ('not_a_norm', 1):
+        with pytest.raises(ValueError):
+            plots.imshow(interpolated_data=data, extent=(0, 1, 0, 1), ax=ax, norm=norm)
+    plt.close(ax.figure)
+
+
+def test_imshow_float32():
+    """Test images are converted to float32 when representable."""
+    _, ax = plt.subplots()
+    data = np.linspace(1e-20, 1e20, 16).reshape(4, 4)
+    image = plots.imshow(interpolated_data=data, extent=(0, 1, 0, 1), ax=ax)
+    assert image.get_array().dtype == np.float32
+
+    data = np.linspace(1e-50, 1.0, 16).reshape(4, 4)
+    image = plots.imshow(interpolated_data=data, extent=(0, 1, 0, 1), ax=ax, norm='log')
+    assert image.get_array().dtype == np.float64
+    plt.close(ax.figure)
+
+
 @pytest.mark.parametrize('snaptype', SNAPTYPES)
 def test_image_projection_with_kwargs(snaptype):
     """Test image projection with kwargs."""
@@ -111,6 +227,115 @@ def test_image_slice_with_kwargs(snaptype):
     snap.close_file()
 
 
+@pytest.mark.parametrize('snaptype', SNAPTYPES)
+def test_interpolation_arrays(snaptype):
+    """Test getting arrays for interpolation from the Snap."""
+    filename = DIR / snaptype.filename
+    snap = plonk.load_snap(filename)
+    snap.rotate(axis=(1, 1, 0), angle=np.pi / 3)
+
+    quantity, x, y, z = _get_arrays_from_str(
+        snap=snap, quantity='velocity', x='y', y='z', interp='slice'
+    )
+    np.testing.assert_array_equal(x, snap.array_in_code_units('y'))
+    np.testing.assert_array_equal(y, snap.array_in_code_units('z'))
+    np.testing.assert_array_equal(z, snap.array_in_code_units('x'))
+    np.testing.assert_array_equal(
+        quantity[:, 0], snap.array_in_code_units('velocity_y')
+    )
+    np.testing.assert_array_equal(
+        quantity[:, 1], snap.array_in_code_units('velocity_z')
+    )
+    *_, z = _get_arrays_from_str(snap=snap, quantity='velocity', x='y', y='z')
+    assert z is None
+
+    if snap.num_dust_species > 0:
+        with pytest.raises(ValueError):
+            _get_arrays_from_str(snap=snap, quantity='dust_fraction', x='x', y='y')
+
+    snap.close_file()
+
+
+@pytest.mark.parametrize('snaptype', SNAPTYPES)
+def test_vector_non_square(snaptype):
+    """Test vector plots on a non-square pixel grid."""
+    filename = DIR / snaptype.filename
+    snap = plonk.load_snap(filename)
+
+    ax = plonk.vector(
+        snap=snap, quantity='velocity', num_pixels=(40, 30), number_of_arrows=(8, 6),
+    )
+    assert ax.collections[0].U.shape == (6 * 8,)
+
+    snap.close_file()
+
+
+def test_plots_rasterized():
+    """Test large particle and quiver plots are rasterized by default."""
+    rng = np.random.default_rng(42)
+    x, y = rng.random((2, plots.RASTERIZE_THRESHOLD + 1))
+    _, ax = plt.subplots()
+    assert plots.plot(x=x, y=y, ax=ax)[0].get_rasterized()
+    assert plots.scatter(x=x, y=y, c=x, n_samples=len(x), ax=ax).get_rasterized()
+    assert not plots.plot(x=x[:100], y=y[:100], ax=ax)[0].get_rasterized()
+    assert not plots.plot(x=x, y=y, ax=ax, rasterized=False)[0].get_rasterized()
+    plt.close(ax.figure)
+
+
+def test_vector_plots_non_square():
+    """Test quiver and streamplot on a non-square pixel grid."""
+    x, y = np.meshgrid(np.linspace(-1, 1, 40), np.linspace(-2, 2, 30))
+    interpolated_data = np.stack((-y, x))
+    extent = (-1, 1, -2, 2)
+
+    _, ax = plt.subplots()
+    plots.quiver(
+        interpolated_data=interpolated_data,
+        extent=extent,
+        ax=ax,
+        number_of_arrows=(8, 6),
+    )
+    plots.streamplot(interpolated_data=interpolated_data, extent=extent, ax=ax)
+    plt.close(ax.figure)
+
+
+def test_contour_non_square():
+    """Test contour on a non-square pixel grid."""
+    x, y = np.meshgrid(np.linspace(-1, 1, 40), np.linspace(-2, 2, 30))
+    interpolated_data = x + 0 * y
+
+    _, ax = plt.subplots()
+    contour = plots.contour(
+        interpolated_data=interpolated_data, extent=(-1, 1, -2, 2), ax=ax, levels=[0.5]
+    )
+    # The contour x = 0.5 is a vertical line
+    vertices = contour.collections[0].get_paths()[0].vertices
+    np.testing.assert_allclose(vertices[:, 0], 0.5)
+    plt.close(ax.figure)
+
+
+def test_quiver_normalize_vectors():
+    """Test quiver vector normalization with zero vectors."""
+    x, y = np.meshgrid(np.linspace(0, 1, 21), np.linspace(0, 1, 21))
+    interpolated_data = np.stack((-y, x))
+    original_data = interpolated_data.copy()
+
+    _, ax = plt.subplots()
+    quiver = plots.quiver(
+        interpolated_data=interpolated_data,
+        extent=(0, 1, 0, 1),
+        ax=ax,
+        number_of_arrows=(7, 7),
+        normalize_vectors=True,
+    )
+    norm = np.hypot(quiver.U, quiver.V)
+    assert np.all(np.isfinite(norm))
+    np.testing.assert_allclose(norm[norm > 0], 1.0)
+    assert np.sum(norm == 0) == 1
+    np.testing.assert_array_equal(interpolated_data, original_data)
+    plt.close(ax.figure)
+
+
 @pytest.mark.parametrize('snaptype', SNAPTYPES)
 def test_plot_smoothing_length(snaptype):
     """Test plot smoothing length as circle."""